@@ -3,6 +3,7 @@ Coverage Map Visualization Module - Updated with 3 Steps
 Place this file at: src/application/services/coverage_map_service.py
 """
 
+import hashlib
 import folium
 import streamlit as st
 from branca.element import MacroElement, Template
@@ -11,6 +12,9 @@ import polars as pl
 import math
 from typing import List, Tuple
 
+# Rendered coverage maps kept in the Streamlit cache
+MAP_CACHE_ENTRIES = 16
+
 
 class CoverageMapVisualization:
     """Clean visualization for cell coverage with 3-step approach"""
@@ -85,8 +89,6 @@ class CoverageMapVisualization:
             if i < len(cell_colors):
                 self.cell_colors[cell_name] = cell_colors[i]
             else:
-                import hashlib
-
                 color_hex = hashlib.md5(cell_name.encode()).hexdigest()[:6]
                 self.cell_colors[cell_name] = f"#{color_hex}"
 
@@ -438,8 +440,8 @@ class CoverageMapVisualization:
         legend._template = Template(legend_html)
         self.map.get_root().add_child(legend)
 
-    def display(self):
-        """Display map in Streamlit"""
+    def to_html(self) -> str:
+        """Add legend / controls and render the map to HTML"""
         self._add_cell_legend()
         folium.LayerControl(position="topright", collapsed=False).add_to(self.map)
 
@@ -448,7 +450,29 @@ class CoverageMapVisualization:
         except Exception:
             pass
 
-        st.components.v1.html(self.map._repr_html_(), height=650, scrolling=False)
+        return self.map._repr_html_()
+
+    def display(self):
+        """Display map in Streamlit"""
+        st.components.v1.html(self.to_html(), height=650, scrolling=False)
+
+
+def _frame_key(df: pl.DataFrame) -> tuple:
+    """Cheap content key for a coverage frame (schema + row hashes)"""
+    return (str(df.schema), df.height, df.hash_rows().sum())
+
+
+@st.cache_data(
+    max_entries=MAP_CACHE_ENTRIES,
+    show_spinner=False,
+    hash_funcs={pl.DataFrame: _frame_key},
+)
+def _coverage_map_html(df_coverage: pl.DataFrame) -> str:
+    """3-step coverage map HTML, rebuilt only when the coverage data changes"""
+    viz = CoverageMapVisualization()
+    viz.initialize_map(df_coverage)
+    viz.add_coverage_layers_3step(df_coverage)
+    return viz.to_html()
 
 
 def render_coverage_map_3step(results: dict):
@@ -460,10 +484,8 @@ def render_coverage_map_3step(results: dict):
         return
 
     with st.spinner("Generating 3-step coverage map..."):
-        viz = CoverageMapVisualization()
-        viz.initialize_map(df_coverage)
-        viz.add_coverage_layers_3step(df_coverage)
-        viz.display()
+        map_html = _coverage_map_html(df_coverage)
+        st.components.v1.html(map_html, height=650, scrolling=False)
         # st.container(border=True)
 
 
@@ -2,12 +2,27 @@
 Dashboard service - Business logic for dashboard queries
 """
 
-from typing import Optional, List, Dict
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Iterator, Tuple
 from datetime import datetime
 import polars as pl
 from src.infrastructure.database.repository import DatabaseRepository
 from src.application.services.hourly_data_service import HourlyDataService
 
+# One worker per task submitted by iter_query_results (seven table
+# queries, the eNodeBId lookup and the two combine / merge steps)
+QUERY_WORKERS = 10
+
+# Seconds a Managed Element's query results are reused
+QUERY_RESULTS_TTL = 600
+
+# Query result sets kept at most; least recently used are evicted first
+QUERY_RESULTS_MAX_ENTRIES = 16
+
 
 class DashboardService:
     """Service layer for dashboard data queries"""
@@ -16,6 +31,12 @@ class DashboardService:
         self._repository = repository
         self._hourly_service = HourlyDataService(repository)
 
+        # Query results per (element, date range, database mtime) with the
+        # time they were stored, in LRU order; the service is shared across
+        # reruns
+        self._results_cache: "OrderedDict[tuple, Tuple[float, dict]]" = OrderedDict()
+        self._results_lock = threading.Lock()
+
     def get_managed_elements(self) -> List[str]:
         """Get unique Managed Element values from tbl_timingadvance"""
         try:
@@ -43,68 +64,182 @@ class DashboardService:
             start_date: Start date for hourly data (optional)
             end_date: End date for hourly data (optional)
         """
+        return dict(self.iter_query_results(managed_element, start_date, end_date))
+
+    def iter_query_results(
+        self,
+        managed_element: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[Tuple[str, Optional[pl.DataFrame]]]:
+        """
+        Execute all queries for a given Managed Element
+        Yields (results key, result) pairs as soon as each query finishes
+
+        Independent queries run concurrently; queries that depend on an
+        earlier result (augmented TA / GCell on SCOT, hourly data on eNodeBIds
+        and Mapping, the combined / merged frames on their inputs) wait only
+        for that result. QUERY_WORKERS covers every submitted task, so a
+        waiting task never blocks the one it needs.
+
+        Results are reused for QUERY_RESULTS_TTL seconds, until the
+        database file changes.
+
+        Args:
+            managed_element: The Managed Element to query
+            start_date: Start date for hourly data (optional)
+            end_date: End date for hourly data (optional)
+        """
+        cache_key = (managed_element, start_date, end_date, self.get_data_version())
+        cached = self._get_cached_results(cache_key)
+        if cached is not None:
+            yield from cached.items()
+            return
+
         results = {}
 
-        # Query: SCOT (combined SiteID and NCELL SiteID)
-        results["scot"] = self._query_scot_combined(managed_element)
+        with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as executor:
+            futures = {}
 
-        # Query: LTE Timing Advance - augmented
-        results["timingadvance"] = self._query_timingadvance_augmented(
-            managed_element, results["scot"]
-        )
+            # Query: SCOT (combined SiteID and NCELL SiteID)
+            futures["scot"] = executor.submit(
+                self._query_scot_combined, managed_element
+            )
 
-        # Query: LTE Timing Advance - original
-        results["timingadvance_original"] = self._query_timingadvance_original(
-            managed_element
-        )
+            # Query: LTE Timing Advance - original
+            futures["timingadvance_original"] = executor.submit(
+                self._query_timingadvance_original, managed_element
+            )
 
-        # Query: GCell - augmented
-        results["gcell"] = self._query_gcell_augmented(managed_element, results["scot"])
+            # Query: Mapping
+            futures["mapping"] = executor.submit(self._query_mapping, managed_element)
 
-        # Query: Mapping
-        results["mapping"] = self._query_mapping(managed_element)
+            enodeb_future = executor.submit(
+                self._hourly_service.get_enodeb_ids_from_timingadvance,
+                managed_element,
+            )
 
-        # Query: LTE Hourly
-        if start_date and end_date:
-            enodeb_ids = self._hourly_service.get_enodeb_ids_from_timingadvance(
-                managed_element
+            # Query: LTE Timing Advance - augmented
+            futures["timingadvance"] = executor.submit(
+                lambda: self._query_timingadvance_augmented(
+                    managed_element, futures["scot"].result()
+                )
             )
-            results["ltehourly"] = self._hourly_service.query_ltehourly_by_daterange(
-                enodeb_ids, start_date, end_date
+
+            # Query: GCell - augmented
+            futures["gcell"] = executor.submit(
+                lambda: self._query_gcell_augmented(
+                    managed_element, futures["scot"].result()
+                )
             )
-        else:
-            enodeb_ids = self._hourly_service.get_enodeb_ids_from_timingadvance(
-                managed_element
+
+            # Query: LTE Hourly
+            futures["ltehourly"] = executor.submit(
+                lambda: self._query_ltehourly(
+                    enodeb_future.result(), start_date, end_date
+                )
             )
-            results["ltehourly"] = self._query_ltehourly_fallback(enodeb_ids)
 
-        # Query: LTE Hourly Combined
-        results["ltehourly_combined"] = self._hourly_service.get_combined_ltehourly(
-            results.get("ltehourly"), results.get("timingadvance")
-        )
+            # Query: 2G Hourly
+            futures["twoghourly"] = executor.submit(
+                lambda: self._query_twoghourly(
+                    futures["mapping"].result(), start_date, end_date
+                )
+            )
 
-        # Query: 2G Hourly
-        if results["mapping"] is not None and not results["mapping"].is_empty():
-            site_names = (
-                results["mapping"]["new Site NAME"].to_list()
-                if "new Site NAME" in results["mapping"].columns
-                else []
+            # Query: LTE Hourly Combined
+            futures["ltehourly_combined"] = executor.submit(
+                lambda: self._hourly_service.get_combined_ltehourly(
+                    futures["ltehourly"].result(), futures["timingadvance"].result()
+                )
             )
-            if start_date and end_date:
-                results["twoghourly"] = (
-                    self._hourly_service.query_twoghourly_by_daterange(
-                        site_names, start_date, end_date
-                    )
+
+            # Query: Merged GCell Coverage
+            futures["gcell_coverage"] = executor.submit(
+                lambda: self._merge_gcell_coverage(
+                    {
+                        key: futures[key].result()
+                        for key in ("gcell", "timingadvance", "scot")
+                    }
                 )
-            else:
-                results["twoghourly"] = self._query_twoghourly_fallback(site_names)
-        else:
-            results["twoghourly"] = None
+            )
+
+            keys = {future: key for key, future in futures.items()}
+            for future in as_completed(keys):
+                key = keys[future]
+                results[key] = future.result()
+                yield key, results[key]
+
+        self._store_cached_results(cache_key, results)
+
+    def get_data_version(self) -> Optional[float]:
+        """
+        Last write time of the database file (None if it does not exist)
+
+        Changes whenever data is imported; used to key cached results.
+        """
+        try:
+            return os.path.getmtime(self._repository.db_path)
+        except OSError:
+            return None
 
-        # Query: Merged GCell Coverage
-        results["gcell_coverage"] = self._merge_gcell_coverage(results)
+    def _get_cached_results(self, cache_key: tuple) -> Optional[dict]:
+        """Cached query results for the key, if stored within the TTL"""
+        with self._results_lock:
+            entry = self._results_cache.get(cache_key)
+            if entry is not None:
+                self._results_cache.move_to_end(cache_key)
+        if entry is None or time.monotonic() - entry[0] > QUERY_RESULTS_TTL:
+            return None
+        return entry[1]
+
+    def _store_cached_results(self, cache_key: tuple, results: dict) -> None:
+        """Store query results, dropping expired and least recently used entries"""
+        now = time.monotonic()
+        with self._results_lock:
+            self._results_cache = OrderedDict(
+                (key, entry)
+                for key, entry in self._results_cache.items()
+                if now - entry[0] <= QUERY_RESULTS_TTL
+            )
+            self._results_cache[cache_key] = (now, results)
+            self._results_cache.move_to_end(cache_key)
+            while len(self._results_cache) > QUERY_RESULTS_MAX_ENTRIES:
+                self._results_cache.popitem(last=False)
+
+    def _query_ltehourly(
+        self,
+        enodeb_ids: List[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Optional[pl.DataFrame]:
+        """LTE Hourly for the date range, or the latest rows without one"""
+        if start_date and end_date:
+            return self._hourly_service.query_ltehourly_by_daterange(
+                enodeb_ids, start_date, end_date
+            )
+        return self._query_ltehourly_fallback(enodeb_ids)
 
-        return results
+    def _query_twoghourly(
+        self,
+        mapping: Optional[pl.DataFrame],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Optional[pl.DataFrame]:
+        """2G Hourly for the sites in Mapping"""
+        if mapping is None or mapping.is_empty():
+            return None
+
+        site_names = (
+            mapping["new Site NAME"].to_list()
+            if "new Site NAME" in mapping.columns
+            else []
+        )
+        if start_date and end_date:
+            return self._hourly_service.query_twoghourly_by_daterange(
+                site_names, start_date, end_date
+            )
+        return self._query_twoghourly_fallback(site_names)
 
     def _query_timingadvance_augmented(
         self, managed_element: str, scot_data: Optional[pl.DataFrame]
@@ -127,12 +262,12 @@ class DashboardService:
                     managed_values.extend(valid_ncell_ids)
 
             if len(managed_values) == 1:
-                query = f"SELECT * FROM tbl_timingadvance WHERE \"Managed Element\" = '{managed_element}'"
+                query = 'SELECT * FROM tbl_timingadvance WHERE "Managed Element" = ?'
             else:
-                managed_str = "','".join(managed_values)
-                query = f"SELECT * FROM tbl_timingadvance WHERE \"Managed Element\" IN ('{managed_str}')"
+                managed_in_clause = ",".join("?" * len(managed_values))
+                query = f'SELECT * FROM tbl_timingadvance WHERE "Managed Element" IN ({managed_in_clause})'
 
-            return self._repository.query(query)
+            return self._repository.query(query, managed_values)
         except Exception as e:
             print(f"Error querying augmented Timing Advance: {str(e)}")
             return self._query_timingadvance_original(managed_element)
@@ -142,8 +277,8 @@ class DashboardService:
     ) -> Optional[pl.DataFrame]:
         """Original Timing Advance query"""
         try:
-            query = f"SELECT * FROM tbl_timingadvance WHERE \"Managed Element\" = '{managed_element}'"
-            return self._repository.query(query)
+            query = 'SELECT * FROM tbl_timingadvance WHERE "Managed Element" = ?'
+            return self._repository.query(query, [managed_element])
         except Exception as e:
             print(f"Error querying original Timing Advance: {str(e)}")
             return None
@@ -169,12 +304,12 @@ class DashboardService:
                     msc_values.extend(valid_ncell_ids)
 
             if len(msc_values) == 1:
-                query = f"SELECT * FROM tbl_gcell WHERE \"MSC\" = '{managed_element}'"
+                query = 'SELECT * FROM tbl_gcell WHERE "MSC" = ?'
             else:
-                msc_str = "','".join(msc_values)
-                query = f"SELECT * FROM tbl_gcell WHERE \"MSC\" IN ('{msc_str}')"
+                msc_in_clause = ",".join("?" * len(msc_values))
+                query = f'SELECT * FROM tbl_gcell WHERE "MSC" IN ({msc_in_clause})'
 
-            return self._repository.query(query)
+            return self._repository.query(query, msc_values)
         except Exception as e:
             print(f"Error querying augmented GCell: {str(e)}")
             return None
@@ -182,12 +317,12 @@ class DashboardService:
     def _query_scot_combined(self, managed_element: str) -> Optional[pl.DataFrame]:
         """Query tbl_scot"""
         try:
-            query = f"""
+            query = """
             SELECT * FROM tbl_scot 
-            WHERE "SiteID" = '{managed_element}' 
-            OR "NCELL SiteID" = '{managed_element}'
+            WHERE "SiteID" = ? 
+            OR "NCELL SiteID" = ?
             """
-            return self._repository.query(query)
+            return self._repository.query(query, [managed_element, managed_element])
         except Exception as e:
             print(f"Error querying SCOT: {str(e)}")
             return None
@@ -195,8 +330,8 @@ class DashboardService:
     def _query_mapping(self, managed_element: str) -> Optional[pl.DataFrame]:
         """Query tbl_mapping"""
         try:
-            query = f"SELECT * FROM tbl_mapping WHERE \"New Tower ID\" = '{managed_element}'"
-            return self._repository.query(query)
+            query = 'SELECT * FROM tbl_mapping WHERE "New Tower ID" = ?'
+            return self._repository.query(query, [managed_element])
         except Exception as e:
             print(f"Error querying Mapping: {str(e)}")
             return None
@@ -223,7 +358,7 @@ class DashboardService:
             if not valid_enodeb_ids:
                 return None
 
-            enodeb_in_clause = ",".join([f"'{eid}'" for eid in valid_enodeb_ids])
+            enodeb_in_clause = ",".join("?" * len(valid_enodeb_ids))
             query = f"""
             SELECT * FROM tbl_ltehourly 
             WHERE "eNodeBId" IN ({enodeb_in_clause})
@@ -231,7 +366,7 @@ class DashboardService:
             LIMIT 100
             """
 
-            return self._repository.query(query)
+            return self._repository.query(query, valid_enodeb_ids)
         except Exception as e:
             print(f"Error in LTE Hourly fallback: {str(e)}")
             return None
@@ -244,15 +379,15 @@ class DashboardService:
             if not site_names:
                 return None
 
-            site_names_clean = [str(name).replace("'", "''") for name in site_names]
-            site_in_clause = ",".join([f"'{name}'" for name in site_names_clean])
+            site_in_clause = ",".join("?" * len(site_names))
             query = f"""
             SELECT * FROM tbl_twoghourly 
             WHERE "SITE Name" IN ({site_in_clause}) 
             ORDER BY "Begin Time" DESC 
             LIMIT 100
             """
-            return self._repository.query(query)
+            params = [str(name) for name in site_names]
+            return self._repository.query(query, params)
         except Exception as e:
             print(f"Error in 2G Hourly fallback: {str(e)}")
             return None
@@ -14,6 +14,20 @@ class HourlyDataService:
     def __init__(self, repository: DatabaseRepository):
         self._repository = repository
 
+    def _mark_sorted_by_begin_time(
+        self, result: Optional[pl.DataFrame]
+    ) -> Optional[pl.DataFrame]:
+        """
+        Flag "Begin Time" as sorted descending on a date-range query result
+
+        The query orders by "Begin Time" DESC and its range filter excludes
+        NULLs; SQLite's BINARY text order matches Polars' string order, so
+        min / max / sort on the column can use Polars' sorted fast paths.
+        """
+        if result is None or result.schema.get("Begin Time") != pl.String:
+            return result
+        return result.with_columns(pl.col("Begin Time").set_sorted(descending=True))
+
     def get_enodeb_ids_from_timingadvance(self, managed_element: str) -> List[str]:
         """
         Get eNodeBId list from tbl_timingadvance
@@ -25,14 +39,14 @@ class HourlyDataService:
             List of eNodeBId values
         """
         try:
-            query = f"""
+            query = """
             SELECT DISTINCT "eNodeBId" 
             FROM tbl_timingadvance 
-            WHERE "Managed Element" = '{managed_element}'
+            WHERE "Managed Element" = ?
             AND "eNodeBId" IS NOT NULL
             """
 
-            result = self._repository.query(query)
+            result = self._repository.query(query, (managed_element,))
 
             if result is not None and not result.is_empty():
                 enodeb_ids = result["eNodeBId"].unique().to_list()
@@ -98,23 +112,26 @@ class HourlyDataService:
             start_date_str = start_date.strftime("%Y-%m-%d 00:00:00")
             end_date_str = end_date.strftime("%Y-%m-%d 23:59:59")
 
-            # Build IN clause
-            enodeb_in_clause = ",".join([f"'{eid}'" for eid in valid_enodeb_ids])
+            # Build IN clause (values bound as parameters)
+            enodeb_in_clause = ",".join("?" * len(valid_enodeb_ids))
 
             # Query dengan filter date range
             query = f"""
             SELECT * FROM tbl_ltehourly 
             WHERE "eNodeBId" IN ({enodeb_in_clause})
-            AND "Begin Time" >= '{start_date_str}'
-            AND "Begin Time" <= '{end_date_str}'
+            AND "Begin Time" >= ?
+            AND "Begin Time" <= ?
             ORDER BY "Begin Time" DESC
             """
+            params = valid_enodeb_ids + [start_date_str, end_date_str]
 
             print(
                 f"DEBUG: LTE Hourly query - Date range: {start_date_str} to {end_date_str}"
             )
 
-            result = self._repository.query(query)
+            result = self._mark_sorted_by_begin_time(
+                self._repository.query(query, params)
+            )
 
             if result is not None and not result.is_empty():
                 print(f"DEBUG: SUCCESS - Found {len(result)} LTE Hourly records")
@@ -150,23 +167,25 @@ class HourlyDataService:
             start_date_str = start_date.strftime("%Y-%m-%d 00:00:00")
             end_date_str = end_date.strftime("%Y-%m-%d 23:59:59")
 
-            # Create IN clause
-            site_names_clean = [str(name).replace("'", "''") for name in site_names]
-            site_in_clause = ",".join([f"'{name}'" for name in site_names_clean])
+            # Create IN clause (values bound as parameters)
+            site_in_clause = ",".join("?" * len(site_names))
 
             query = f"""
             SELECT * FROM tbl_twoghourly 
             WHERE "SITE Name" IN ({site_in_clause})
-            AND "Begin Time" >= '{start_date_str}'
-            AND "Begin Time" <= '{end_date_str}'
+            AND "Begin Time" >= ?
+            AND "Begin Time" <= ?
             ORDER BY "Begin Time" DESC
             """
+            params = [str(name) for name in site_names] + [start_date_str, end_date_str]
 
             print(
                 f"DEBUG: 2G Hourly query - Date range: {start_date_str} to {end_date_str}"
             )
 
-            result = self._repository.query(query)
+            result = self._mark_sorted_by_begin_time(
+                self._repository.query(query, params)
+            )
 
             if result is not None and not result.is_empty():
                 print(f"DEBUG: SUCCESS - Found {len(result)} 2G Hourly records")
@@ -512,7 +512,7 @@ def render_combined_analysis_section(df_combined: pl.DataFrame):
     with st.expander("📍 Sector Statistics"):
         sector_stats = analyzer.get_sector_statistics()
         if sector_stats is not None:
-            st.dataframe(sector_stats.to_pandas(), width="stretch")
+            st.dataframe(sector_stats, width="stretch")
 
             # Pie chart
             fig_pie = analyzer.plot_sector_traffic_pie()
@@ -523,7 +523,7 @@ def render_combined_analysis_section(df_combined: pl.DataFrame):
     with st.expander("📡 Frequency Band Statistics"):
         band_stats = analyzer.get_frequency_band_statistics()
         if band_stats is not None:
-            st.dataframe(band_stats.to_pandas(), width="stretch")
+            st.dataframe(band_stats, width="stretch")
 
             # Bar chart
             fig_bar = analyzer.plot_band_traffic_bar()
@@ -534,7 +534,7 @@ def render_combined_analysis_section(df_combined: pl.DataFrame):
     with st.expander("🏆 Top 10 Cells by Traffic"):
         top_cells = analyzer.get_top_cells_by_traffic(10)
         if top_cells is not None:
-            st.dataframe(top_cells.to_pandas(), width="stretch")
+            st.dataframe(top_cells, width="stretch")
 
     # Time Series
     with st.expander("📈 Traffic Time Series"):
@@ -547,7 +547,7 @@ def render_combined_analysis_section(df_combined: pl.DataFrame):
     unmatched = analyzer.get_unmatched_cells()
     if unmatched is not None and not unmatched.is_empty():
         with st.expander(f"⚠️ Unmatched Cells ({len(unmatched)})"):
-            st.dataframe(unmatched.to_pandas(), width="stretch")
+            st.dataframe(unmatched, width="stretch")
 
 
 # ===========================================
@@ -3,7 +3,7 @@ Interface for database repository (Dependency Inversion Principle)
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Sequence, Tuple
 import polars as pl
 
 
@@ -22,12 +22,22 @@ class IDatabaseRepository(ABC):
         """Get information about a table"""
         pass
 
+    @abstractmethod
+    def get_table_infos(self, table_names: List[str]) -> Dict[str, dict]:
+        """Get information about several tables at once"""
+        pass
+
     @abstractmethod
     def get_all_tables(self) -> List[str]:
         """Get list of all tables"""
         pass
 
     @abstractmethod
-    def query(self, sql: str) -> Optional[pl.DataFrame]:
-        """Execute SQL query"""
+    def search_columns(self, term: str) -> List[dict]:
+        """Find columns matching a search term across all tables"""
+        pass
+
+    @abstractmethod
+    def query(self, sql: str, params: Sequence = ()) -> Optional[pl.DataFrame]:
+        """Execute SQL query with optional ? parameters"""
         pass
@@ -4,22 +4,123 @@ Following Repository Pattern for data access abstraction
 """
 
 import sqlite3
-from typing import Optional, List, Tuple
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, List, Sequence, Tuple
 from pathlib import Path
 import polars as pl
 from src.domain.interfaces.i_database_repository import IDatabaseRepository
 
+# Upper bound for SQLite memory-mapped I/O (1 GiB)
+MMAP_SIZE = 1 << 30
+
+# Rows per executemany() batch when writing imported data
+INSERT_BATCH_SIZE = 10_000
+
+# Appends larger than this drop and recreate secondary indexes around the load
+INDEX_REBUILD_MIN_ROWS = 50_000
+
+# TEMP table used to deduplicate rows inside SQLite during import
+STAGING_TABLE = "import_staging"
+
+# Rows ANALYZE samples per index, so post-import statistics stay cheap
+ANALYSIS_LIMIT = 1000
+
+# Rows fetched from the cursor at a time when reading query results
+QUERY_BATCH_SIZE = 50_000
+
+# Regex patterns evaluated inside Polars (Rust regex DFA, no Python loop)
+ALPHA_PATTERN = r"[A-Za-z]"
+# Plain or thousand-separated number, e.g. "12", "-1,660.50", "3.2e5"
+NUMBER_PATTERN = r"^\s*[-+]?(?:\d[\d,]*(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?\s*$"
+
+# Metadata lookups with bound parameters - the SQL text never changes, so
+# sqlite3's per-connection statement cache reuses the prepared statements
+TABLE_EXISTS_SQL = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+TABLE_COLUMNS_SQL = "SELECT name FROM pragma_table_info(?) ORDER BY cid"
+TABLE_INDEXES_SQL = (
+    "SELECT name, sql FROM sqlite_master "
+    "WHERE type='index' AND tbl_name=? AND sql IS NOT NULL"
+)
+TABLE_SCHEMA_SQL = (
+    'SELECT cid, name, type, "notnull", dflt_value, pk '
+    "FROM pragma_table_info(?) ORDER BY cid"
+)
+
 
 class DatabaseRepository(IDatabaseRepository):
     """SQLite database repository implementation"""
 
     def __init__(self, db_path: str = "mydatabase.db"):
         self.db_path = db_path
+
+        # Lazily opened connection shared by all operations; the lock
+        # serializes access when several imports run concurrently
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.RLock()
+
+        # Idle connections for read-only queries, so concurrent dashboard
+        # queries do not queue up behind the shared lock
+        self._read_pool: List[sqlite3.Connection] = []
+
+        # Per-instance metadata caches, cleared after every import
+        self._cached_table_info = lru_cache(maxsize=128)(self._fetch_table_info)
+        self._cached_all_tables = lru_cache(maxsize=1)(self._fetch_all_tables)
+        self._cached_column_index = lru_cache(maxsize=1)(self._fetch_column_index)
+
         self._initialize_database()
 
+    def _get_conn(self) -> sqlite3.Connection:
+        """Open the shared connection on first use"""
+        if self._conn is None:
+            self._conn = self._open_conn()
+        return self._conn
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Idle read connection (opened if none is free), returned on exit"""
+        with self._conn_lock:
+            conn = self._read_pool.pop() if self._read_pool else None
+        if conn is None:
+            conn = self._open_conn()
+        try:
+            yield conn
+        finally:
+            with self._conn_lock:
+                self._read_pool.append(conn)
+
+    def _open_conn(self) -> sqlite3.Connection:
+        """New connection with the repository's PRAGMA settings"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Read pages through mmap instead of the pager's read() calls
+        conn.execute(f"PRAGMA mmap_size={self._mmap_size()}")
+        return conn
+
+    def _mmap_size(self) -> int:
+        """MMAP_SIZE capped to a quarter of the address-space rlimit, if set"""
+        try:
+            import resource
+        except ImportError:
+            # Not available on Windows
+            return MMAP_SIZE
+
+        soft_limit, _ = resource.getrlimit(resource.RLIMIT_AS)
+        if soft_limit == resource.RLIM_INFINITY:
+            return MMAP_SIZE
+        return min(MMAP_SIZE, soft_limit // 4)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Shared connection held under the lock, committed / rolled back on exit"""
+        with self._conn_lock:
+            conn = self._get_conn()
+            with conn:
+                yield conn
+
     def _initialize_database(self) -> None:
         """Create database and tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
 
             # Note: Tables are created dynamically on first import
@@ -60,83 +161,67 @@ class DatabaseRepository(IDatabaseRepository):
             return False, f"Database error: {str(e)}"
         except Exception as e:
             return False, f"Error: {str(e)}"
+        finally:
+            self._clear_metadata_cache()
+
+    def _clear_metadata_cache(self) -> None:
+        """Invalidate cached table list / table info after schema or data changes"""
+        self._cached_table_info.cache_clear()
+        self._cached_all_tables.cache_clear()
+        self._cached_column_index.cache_clear()
 
     def _import_with_header(
         self, csv_path: str, table_name: str, import_type: str
     ) -> Tuple[bool, str]:
         """Import CSV using header names for column mapping"""
-        # Read CSV with Polars - read all as string first to handle formatting
-        df = pl.read_csv(
-            csv_path,
-            infer_schema_length=0,  # Read all as string
-            ignore_errors=True,
-            truncate_ragged_lines=True,
-            null_values=["", "NULL", "null", "N/A", "n/a", "-"],
-        )
+        # Scan CSV lazily with Polars - read all as string first to handle formatting
+        lf = self._scan_csv(csv_path)
 
-        if df.is_empty():
+        if self._is_empty(lf):
             return False, "CSV file is empty"
 
-        # Store original row count
-        original_rows = len(df)
-
-        # Clean numeric columns
-        df = self._clean_numeric_columns(df)
-
-        # Remove duplicate rows
-        df = df.unique()
-        final_rows = len(df)
-
-        # Convert to Pandas
-        df_pandas = df.to_pandas()
+        # Clean numeric columns, then stream-collect
+        df = self._collect_import(lf)
+        original_rows = df.height
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             if import_type == "replace":
                 cursor = conn.cursor()
                 cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
                 conn.commit()
 
-            if_exists_mode = "replace" if import_type == "replace" else "append"
-
             if import_type == "append":
                 table_exists = self._table_exists(conn, table_name)
 
                 if table_exists:
                     existing_cols = self._get_table_columns(conn, table_name)
-                    csv_cols = list(df_pandas.columns)
+                    csv_cols = list(df.columns)
+
+                    # Build lookup set once, keep list for stable column order.
+                    # SQLite column names are case-insensitive, so compare
+                    # lowercased names (a CSV "cellid" matches table "CellId")
+                    existing_set = {c.lower() for c in existing_cols}
+                    new_cols = []
+                    for c in csv_cols:
+                        if c.lower() not in existing_set:
+                            existing_set.add(c.lower())
+                            new_cols.append(c)
 
                     # Add missing columns
-                    new_cols = set(csv_cols) - set(existing_cols)
-                    if new_cols:
-                        cursor = conn.cursor()
-                        for col in new_cols:
-                            col_type = self._infer_column_type(df_pandas[col])
-                            try:
-                                cursor.execute(
-                                    f'ALTER TABLE {table_name} ADD COLUMN "{col}" {col_type}'
-                                )
-                            except sqlite3.OperationalError:
-                                pass
-                        conn.commit()
-
-                    # Fill missing columns with None
-                    missing_in_csv = set(existing_cols) - set(csv_cols)
-                    for col in missing_in_csv:
-                        df_pandas[col] = None
-
-                    # Reorder columns
-                    all_cols = existing_cols + [
-                        c for c in csv_cols if c not in existing_cols
-                    ]
-                    df_pandas = df_pandas[all_cols]
+                    self._add_columns(
+                        conn,
+                        table_name,
+                        [
+                            (col, self._infer_column_type(df.get_column(col)))
+                            for col in new_cols
+                        ],
+                    )
+
+                    # Table columns missing from the CSV are left out of the
+                    # INSERT column list, SQLite fills them with NULL
 
             # Insert data
-            df_pandas.to_sql(
-                table_name,
-                conn,
-                if_exists=if_exists_mode if import_type == "replace" else "append",
-                index=False,
-            )
+            final_rows = self._write_frame(conn, df, table_name)
 
         # Success message
         message = f"Successfully imported {final_rows:,} rows"
@@ -153,25 +238,18 @@ class DatabaseRepository(IDatabaseRepository):
         Import CSV ignoring headers, using column positions
         Starts reading from row 2 (skips header row)
         """
-        # Read CSV starting from row 2 (skip_rows=1)
-        df = pl.read_csv(
+        # Scan CSV starting from row 2 (skip_rows=1)
+        lf = self._scan_csv(
             csv_path,
             skip_rows=1,  # Skip header row
             has_header=False,  # Don't use first row as header
-            infer_schema_length=0,  # Read all as string
-            ignore_errors=True,
-            truncate_ragged_lines=True,
-            null_values=["", "NULL", "null", "N/A", "n/a", "-"],
         )
 
-        if df.is_empty():
+        if self._is_empty(lf):
             return False, "CSV file is empty (no data rows after header)"
 
-        # Store original row count
-        original_rows = len(df)
-
         # Get or create column names based on table structure
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             table_exists = self._table_exists(conn, table_name)
 
             if table_exists and import_type == "append":
@@ -179,35 +257,31 @@ class DatabaseRepository(IDatabaseRepository):
                 existing_cols = self._get_table_columns(conn, table_name)
 
                 # Adjust dataframe to match existing columns
-                num_csv_cols = len(df.columns)
+                num_csv_cols = lf.collect_schema().len()
                 num_table_cols = len(existing_cols)
 
-                if num_csv_cols < num_table_cols:
-                    # CSV has fewer columns, add None columns
-                    for i in range(num_csv_cols, num_table_cols):
-                        df = df.with_columns(pl.lit(None).alias(f"column_{i + 1}"))
-                elif num_csv_cols > num_table_cols:
+                # CSV with fewer columns: trailing table columns are left out
+                # of the INSERT column list, SQLite fills them with NULL
+                if num_csv_cols > num_table_cols:
                     # CSV has more columns, need to add them to table
                     # Use generic names for new columns
-                    extra_cols = num_csv_cols - num_table_cols
-                    cursor = conn.cursor()
-                    for i in range(extra_cols):
-                        new_col_name = f"column_{num_table_cols + i + 1}"
-                        try:
-                            cursor.execute(
-                                f'ALTER TABLE {table_name} ADD COLUMN "{new_col_name}" TEXT'
-                            )
-                        except sqlite3.OperationalError:
-                            pass
-                    conn.commit()
-                    existing_cols = self._get_table_columns(conn, table_name)
+                    existing_set = {c.lower() for c in existing_cols}
+                    new_col_names = [
+                        f"column_{i + 1}"
+                        for i in range(num_table_cols, num_csv_cols)
+                        if f"column_{i + 1}" not in existing_set
+                    ]
+                    self._add_columns(
+                        conn, table_name, [(col, "TEXT") for col in new_col_names]
+                    )
+                    existing_cols = existing_cols + new_col_names
 
                 # Rename dataframe columns to match table
-                df.columns = existing_cols[: len(df.columns)]
+                lf = self._rename_positional(lf, existing_cols)
 
             else:
                 # New table or replace mode - generate column names
-                num_cols = len(df.columns)
+                num_cols = lf.collect_schema().len()
 
                 # Try to read first row of original CSV to get header names
                 try:
@@ -220,31 +294,25 @@ class DatabaseRepository(IDatabaseRepository):
                             f"column_{i + 1}" for i in range(len(col_names), num_cols)
                         ]
 
-                    df.columns = col_names[:num_cols]
+                    lf = self._rename_positional(lf, col_names)
                 except:
                     # Fallback to generic names
-                    df.columns = [f"column_{i + 1}" for i in range(num_cols)]
-
-        # Clean numeric columns
-        df = self._clean_numeric_columns(df)
-
-        # Remove duplicates
-        df = df.unique()
-        final_rows = len(df)
+                    lf = self._rename_positional(
+                        lf, [f"column_{i + 1}" for i in range(num_cols)]
+                    )
 
-        # Convert to Pandas
-        df_pandas = df.to_pandas()
+        # Clean numeric columns, then stream-collect
+        df = self._collect_import(lf)
+        original_rows = df.height
 
         # Import to database
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             if import_type == "replace":
                 cursor = conn.cursor()
                 cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
                 conn.commit()
 
-            if_exists_mode = "replace" if import_type == "replace" else "append"
-
-            df_pandas.to_sql(table_name, conn, if_exists=if_exists_mode, index=False)
+            final_rows = self._write_frame(conn, df, table_name)
 
         # Success message
         message = f"Successfully imported {final_rows:,} rows (header ignored, position-based)"
@@ -254,19 +322,157 @@ class DatabaseRepository(IDatabaseRepository):
 
         return True, message
 
+    def _scan_csv(self, csv_path: str, **kwargs) -> pl.LazyFrame:
+        """Lazily scan CSV with every column read as string"""
+        return pl.scan_csv(
+            csv_path,
+            infer_schema_length=0,  # Read all as string
+            ignore_errors=True,
+            truncate_ragged_lines=True,
+            null_values=["", "NULL", "null", "N/A", "n/a", "-"],
+            **kwargs,
+        )
+
+    def _is_empty(self, lf: pl.LazyFrame) -> bool:
+        """Check for data rows without scanning the whole file"""
+        return lf.head(1).collect().is_empty()
+
+    def _rename_positional(
+        self, lf: pl.LazyFrame, col_names: List[str]
+    ) -> pl.LazyFrame:
+        """Rename columns by position (extra names are ignored)"""
+        return lf.rename(dict(zip(lf.collect_schema().names(), col_names)))
+
+    def _collect_import(self, lf: pl.LazyFrame) -> pl.DataFrame:
+        """Clean the scanned CSV and collect it with the streaming engine"""
+        return self._clean_numeric_columns(lf).collect(engine="streaming")
+
+    def _add_columns(
+        self, conn: sqlite3.Connection, table_name: str, columns: List[Tuple[str, str]]
+    ) -> None:
+        """
+        Add (name, type) columns to a table in a single transaction
+        Callers pass only columns not yet present in the table
+        """
+        if not columns:
+            return
+
+        conn.execute("BEGIN")
+        for col, col_type in columns:
+            conn.execute(f'ALTER TABLE {table_name} ADD COLUMN "{col}" {col_type}')
+        conn.commit()
+
+    def _write_frame(
+        self, conn: sqlite3.Connection, df: pl.DataFrame, table_name: str
+    ) -> int:
+        """
+        Write Polars DataFrame straight into SQLite (no pandas round-trip)
+
+        Rows are inserted in executemany batches into a TEMP staging table,
+        then copied with SELECT DISTINCT so SQLite removes duplicate rows
+        using its on-disk sorter instead of an in-memory unique().
+        Creates the target table when missing.
+
+        Returns:
+            Number of distinct rows inserted into the target table
+        """
+        col_defs = ", ".join(
+            f'"{col}" {self._sqlite_type(dtype)}' for col, dtype in df.schema.items()
+        )
+        table_existed = self._table_exists(conn, table_name)
+        if not table_existed:
+            conn.execute(f"CREATE TABLE {table_name} ({col_defs})")
+            previous_rows = 0
+        else:
+            counts = self._get_row_counts(conn.cursor(), [table_name])
+            previous_rows = counts[table_name]
+
+        conn.execute(f"DROP TABLE IF EXISTS temp.{STAGING_TABLE}")
+        conn.execute(f"CREATE TEMP TABLE {STAGING_TABLE} ({col_defs})")
+
+        col_list = ", ".join(f'"{col}"' for col in df.columns)
+        placeholders = ", ".join("?" * df.width)
+        staging_sql = (
+            f"INSERT INTO temp.{STAGING_TABLE} ({col_list}) VALUES ({placeholders})"
+        )
+
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        for batch in df.iter_slices(INSERT_BATCH_SIZE):
+            conn.executemany(staging_sql, batch.iter_rows())
+
+        # Large appends: drop secondary indexes, load, then recreate them
+        # (same transaction, so a failed load keeps the indexes)
+        index_sqls = []
+        if table_existed and df.height > INDEX_REBUILD_MIN_ROWS:
+            index_sqls = self._drop_indexes(conn, table_name)
+
+        cursor = conn.execute(
+            f"INSERT INTO {table_name} ({col_list}) "
+            f"SELECT DISTINCT {col_list} FROM temp.{STAGING_TABLE}"
+        )
+        inserted_rows = cursor.rowcount
+
+        for index_sql in index_sqls:
+            conn.execute(index_sql)
+        conn.execute(f"DROP TABLE temp.{STAGING_TABLE}")
+        conn.commit()
+
+        # Refresh sqlite_stat1 with a bounded sample (no full-table scan),
+        # then pin the exact row count so get_table_info can skip COUNT(*)
+        conn.execute(f"PRAGMA analysis_limit={ANALYSIS_LIMIT}")
+        conn.execute(f"ANALYZE {table_name}")
+        conn.execute(
+            "UPDATE sqlite_stat1 SET stat = ? || substr(stat, instr(stat || ' ', ' ')) "
+            "WHERE tbl = ?",
+            (str(previous_rows + inserted_rows), table_name),
+        )
+        conn.execute("PRAGMA optimize")
+        conn.commit()
+
+        return inserted_rows
+
+    def _drop_indexes(self, conn: sqlite3.Connection, table_name: str) -> List[str]:
+        """
+        Drop explicit indexes of a table
+
+        Returns:
+            CREATE INDEX statements to recreate them after loading
+        """
+        cursor = conn.execute(TABLE_INDEXES_SQL, (table_name,))
+        indexes = cursor.fetchall()
+        for index_name, _ in indexes:
+            conn.execute(f'DROP INDEX "{index_name}"')
+        return [index_sql for _, index_sql in indexes]
+
+    def preview(self, table_name: str, n: int = 5) -> Optional[pl.DataFrame]:
+        """First n rows of a table"""
+        return self.query(f"SELECT * FROM {table_name} LIMIT {n}")
+
+    def _sqlite_type(self, dtype: pl.DataType) -> str:
+        """Map Polars dtype to SQLite column type (same affinity as to_sql)"""
+        if dtype.is_integer() or dtype == pl.Boolean:
+            return "INTEGER"
+        elif dtype.is_float():
+            return "REAL"
+        else:
+            return "TEXT"
+
     def get_table_info(self, table_name: str) -> Optional[dict]:
-        """Get information about a table"""
+        """Get information about a table (memoized until next import)"""
+        return self._cached_table_info(table_name)
+
+    def _fetch_table_info(self, table_name: str) -> Optional[dict]:
+        """Read row count and columns of a table from SQLite"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
 
                 # Get row count
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                row_count = cursor.fetchone()[0]
+                row_count = self._get_row_counts(cursor, [table_name])[table_name]
 
                 # Get column info
-                cursor.execute(f"PRAGMA table_info({table_name})")
-                columns = [row[1] for row in cursor.fetchall()]
+                columns = self._get_table_columns(conn, table_name)
 
                 return {
                     "table_name": table_name,
@@ -276,116 +482,243 @@ class DatabaseRepository(IDatabaseRepository):
         except sqlite3.Error:
             return None
 
+    def get_table_infos(self, table_names: List[str]) -> Dict[str, dict]:
+        """
+        Get information about several tables in one batch of queries
+
+        Returns:
+            Dict of table name -> get_table_info() dict (existing tables only)
+        """
+        if not table_names:
+            return {}
+
+        placeholders = ", ".join("?" * len(table_names))
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    SELECT m.name, p.name
+                    FROM sqlite_master m
+                    JOIN pragma_table_info(m.name) p
+                    WHERE m.type='table' AND m.name IN ({placeholders})
+                    ORDER BY m.name, p.cid
+                """,
+                    list(table_names),
+                )
+                columns: Dict[str, List[str]] = {}
+                for table, col in cursor.fetchall():
+                    columns.setdefault(table, []).append(col)
+
+                row_counts = self._get_row_counts(cursor, list(columns))
+        except sqlite3.Error:
+            return {}
+
+        return {
+            table: {
+                "table_name": table,
+                "row_count": row_counts[table],
+                "columns": cols,
+            }
+            for table, cols in columns.items()
+        }
+
+    def _get_row_counts(
+        self, cursor: sqlite3.Cursor, table_names: List[str]
+    ) -> Dict[str, int]:
+        """
+        Row counts of existing tables: one sqlite_stat1 lookup, then a single
+        UNION ALL of COUNT(*) for tables without statistics
+        """
+        counts: Dict[str, int] = {}
+        if not table_names:
+            return counts
+
+        placeholders = ", ".join("?" * len(table_names))
+        try:
+            cursor.execute(
+                f"SELECT tbl, stat FROM sqlite_stat1 WHERE tbl IN ({placeholders})",
+                table_names,
+            )
+            for table, stat in cursor.fetchall():
+                if stat and table not in counts:
+                    counts[table] = int(stat.split()[0])
+        except (sqlite3.OperationalError, ValueError):
+            # sqlite_stat1 does not exist until the first ANALYZE
+            pass
+
+        missing = [t for t in table_names if t not in counts]
+        if missing:
+            cursor.execute(
+                " UNION ALL ".join(f"SELECT '{t}', COUNT(*) FROM {t}" for t in missing)
+            )
+            counts.update(cursor.fetchall())
+        return counts
+
+    def get_table_schema(self, table_name: str) -> List[tuple]:
+        """
+        Get PRAGMA table_info rows for a table
+
+        Returns:
+            List of (cid, name, type, notnull, dflt_value, pk) tuples
+        """
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(TABLE_SCHEMA_SQL, (table_name,))
+                return cursor.fetchall()
+        except sqlite3.Error:
+            return []
+
     def get_all_tables(self) -> List[str]:
-        """Get list of all tables in database"""
+        """Get list of all tables in database (memoized until next import)"""
+        return list(self._cached_all_tables())
+
+    def _fetch_all_tables(self) -> Tuple[str, ...]:
+        """Read table names from sqlite_master"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT name FROM sqlite_master 
                     WHERE type='table' AND name NOT LIKE 'sqlite_%'
                 """)
-                return [row[0] for row in cursor.fetchall()]
+                return tuple(row[0] for row in cursor.fetchall())
         except sqlite3.Error:
-            return []
-
-    def query(self, sql: str) -> Optional[pl.DataFrame]:
-        """Execute SQL query and return results as Polars DataFrame"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                return pl.read_database(sql, conn)
-        except Exception:
-            return None
+            return ()
 
-    def _clean_numeric_columns(self, df: pl.DataFrame) -> pl.DataFrame:
+    def search_columns(self, term: str) -> List[dict]:
         """
-        Clean numeric columns by removing thousand separators (comma)
-        and converting to proper numeric types
-        """
-        for col in df.columns:
-            # Skip ID and timestamp columns
-            if col.lower() in ["id", "imported_at"]:
-                continue
-
-            try:
-                # Get the column data
-                col_data = df[col]
+        Find columns whose name contains term (case-insensitive)
+        Scans the cached (table, column, lowercase column) index
 
-                # Check if column contains comma-separated numbers
-                sample_values = [
-                    str(val) for val in col_data.head(100) if val is not None
-                ]
-                has_comma = any("," in val for val in sample_values)
-
-                # Check if values contain letters (alphanumeric like "2300F1", "M2", "M3")
-                has_letters = any(
-                    any(c.isalpha() for c in str(val)) for val in sample_values if val
+        Returns:
+            List of {"table": str, "columns": List[str]} in table order
+        """
+        term_lower = term.lower()
+        results: dict = {}
+        for table, col, col_lower in self._cached_column_index():
+            if term_lower in col_lower:
+                results.setdefault(table, []).append(col)
+        return [{"table": t, "columns": cols} for t, cols in results.items()]
+
+    def _fetch_column_index(self) -> Tuple[Tuple[str, str, str], ...]:
+        """Read (table, column, lowercase column) for all tables in one query"""
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT m.name, p.name
+                    FROM sqlite_master m
+                    JOIN pragma_table_info(m.name) p
+                    WHERE m.type='table' AND m.name NOT LIKE 'sqlite_%'
+                    ORDER BY m.name, p.cid
+                """)
+                return tuple(
+                    (table, col, col.lower()) for table, col in cursor.fetchall()
                 )
+        except sqlite3.Error:
+            return ()
 
-                # Check if column appears to be categorical (like Sector: 1,2,3,M2,M3)
-                # If unique values are small compared to total, likely categorical
-                unique_ratio = len(set(sample_values)) / max(len(sample_values), 1)
-                is_likely_categorical = (
-                    unique_ratio < 0.1 and len(set(sample_values)) < 20
-                )
+    def query(self, sql: str, params: Sequence = ()) -> Optional[pl.DataFrame]:
+        """
+        Execute SQL query and return results as Polars DataFrame
 
-                # Only convert to numeric if:
-                # - No letters present
-                # - Not likely categorical
-                # - Has comma separators or looks like numbers
-                if (
-                    not has_letters
-                    and not is_likely_categorical
-                    and (
-                        has_comma
-                        or any(
-                            self._looks_like_number(val) for val in sample_values[:3]
+        params are bound to the query's ? placeholders.
+
+        Runs on a pooled read connection, so queries from several threads
+        execute in parallel. Rows are fetched in QUERY_BATCH_SIZE batches and
+        converted batch by batch, so large hourly results never hold every
+        row as Python tuples at once.
+        """
+        try:
+            with self._read_connection() as conn:
+                cursor = conn.execute(sql, params)
+                columns = [col[0] for col in cursor.description]
+
+                batches = []
+                while rows := cursor.fetchmany(QUERY_BATCH_SIZE):
+                    batches.append(
+                        pl.DataFrame(
+                            rows, schema=columns, orient="row", infer_schema_length=None
                         )
                     )
-                ):
-                    # Clean and convert to numeric
-                    df = df.with_columns(
-                        [
-                            pl.col(col)
-                            .str.replace_all(",", "")  # Remove thousand separator
-                            .str.replace_all(r"^\s+|\s+$", "")  # Trim whitespace
-                            .str.replace("", None)  # Empty string to null
-                            .cast(pl.Float64, strict=False)  # Convert to float
-                            .alias(col)
-                        ]
-                    )
-            except Exception as e:
-                # If conversion fails, keep as string
-                print(f"Warning: Could not convert column {col}: {str(e)}")
-                continue
 
-        return df
+            if not batches:
+                return pl.DataFrame(schema=columns)
+            return pl.concat(batches, how="vertical_relaxed")
+        except Exception:
+            return None
 
-    def _looks_like_number(self, value: str) -> bool:
-        """Check if string looks like a number"""
-        if not value:
-            return False
+    def _clean_numeric_columns(self, df: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Clean numeric columns by removing thousand separators (comma)
+        and converting to proper numeric types
 
-        # Remove commas and whitespace
-        cleaned = value.replace(",", "").strip()
+        Heuristics for every column are computed in a single Polars pass
+        over the first 100 rows, then all conversions run in one
+        with_columns call.
+        """
+        # Skip ID and timestamp columns, only string columns need cleaning
+        candidates = [
+            col
+            for col, dtype in df.collect_schema().items()
+            if col.lower() not in ["id", "imported_at"] and dtype == pl.String
+        ]
+        if not candidates:
+            return df
+
+        stats_exprs = []
+        for col in candidates:
+            sample = pl.col(col).drop_nulls()
+            stats_exprs += [
+                # Check if column contains comma-separated numbers
+                sample.str.contains(",", literal=True).any().alias(f"{col}__comma"),
+                # Check if values contain letters (alphanumeric like "2300F1", "M2")
+                sample.str.contains(ALPHA_PATTERN).any().alias(f"{col}__alpha"),
+                sample.n_unique().alias(f"{col}__unique"),
+                sample.len().alias(f"{col}__count"),
+                # Check if any of the first 3 values looks like a number
+                sample.head(3)
+                .str.contains(NUMBER_PATTERN)
+                .any()
+                .alias(f"{col}__number"),
+            ]
+        stats = df.head(100).select(stats_exprs).collect().row(0, named=True)
+
+        convert_exprs = []
+        for col in candidates:
+            n_unique = stats[f"{col}__unique"]
+            n_values = stats[f"{col}__count"]
+
+            # Check if column appears to be categorical (like Sector: 1,2,3,M2,M3)
+            # If unique values are small compared to total, likely categorical
+            unique_ratio = n_unique / max(n_values, 1)
+            is_likely_categorical = unique_ratio < 0.1 and n_unique < 20
+
+            # Only convert to numeric if:
+            # - No letters present
+            # - Not likely categorical
+            # - Has comma separators or looks like numbers
+            if (
+                not stats[f"{col}__alpha"]
+                and not is_likely_categorical
+                and (stats[f"{col}__comma"] or stats[f"{col}__number"])
+            ):
+                convert_exprs.append(
+                    pl.col(col)
+                    .str.replace_all(",", "", literal=True)  # Remove thousand separator
+                    .str.strip_chars()  # Trim whitespace
+                    .cast(pl.Float64, strict=False)  # Empty string / text to null
+                    .alias(col)
+                )
 
-        # Check if it's a number (int or float)
-        try:
-            float(cleaned)
-            return True
-        except ValueError:
-            return False
+        return df.with_columns(convert_exprs) if convert_exprs else df
 
     def _table_exists(self, conn: sqlite3.Connection, table_name: str) -> bool:
         """Check if table exists in database"""
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name=?
-        """,
-            (table_name,),
-        )
+        cursor.execute(TABLE_EXISTS_SQL, (table_name,))
         return cursor.fetchone() is not None
 
     def _get_table_columns(
@@ -393,32 +726,18 @@ class DatabaseRepository(IDatabaseRepository):
     ) -> List[str]:
         """Get list of columns in a table"""
         cursor = conn.cursor()
-        cursor.execute(f"PRAGMA table_info({table_name})")
-        return [row[1] for row in cursor.fetchall()]
-
-    def _infer_column_type(self, series) -> str:
-        """Infer SQLite column type from pandas series"""
-        import pandas as pd
+        cursor.execute(TABLE_COLUMNS_SQL, (table_name,))
+        return [row[0] for row in cursor.fetchall()]
 
+    def _infer_column_type(self, series: pl.Series) -> str:
+        """Infer SQLite column type from Polars series"""
         # Check if column contains mixed alphanumeric (like "2300F1", "2300F2")
         # This should be treated as TEXT even if it starts with numbers
-        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
-            # Check sample values for mixed content
-            sample_values = series.dropna().head(100).astype(str)
-            if len(sample_values) > 0:
-                # If any value contains letters, treat as TEXT
-                has_letters = sample_values.str.contains("[a-zA-Z]", regex=True).any()
-                if has_letters:
-                    return "TEXT"
+        if series.dtype == pl.String:
+            # If any sample value contains letters, treat as TEXT
+            sample_values = series.drop_nulls().head(100)
+            if sample_values.str.contains(ALPHA_PATTERN).any():
+                return "TEXT"
 
         # Check data type
-        if pd.api.types.is_integer_dtype(series):
-            return "INTEGER"
-        elif pd.api.types.is_float_dtype(series):
-            return "REAL"
-        elif pd.api.types.is_bool_dtype(series):
-            return "INTEGER"
-        elif pd.api.types.is_datetime64_any_dtype(series):
-            return "TEXT"
-        else:
-            return "TEXT"
+        return self._sqlite_type(series.dtype)
@@ -0,0 +1,12 @@
+"""
+Shared resources for the Streamlit pages
+"""
+
+import streamlit as st
+from src.infrastructure.database.repository import DatabaseRepository
+
+
+@st.cache_resource
+def get_repository() -> DatabaseRepository:
+    """Repository shared by every page and rerun (one set of connections)"""
+    return DatabaseRepository()
@@ -2,12 +2,41 @@
 Schema Viewer - Minor cleanup, no major changes needed.
 """
 
+import os
 import streamlit as st
-import sqlite3
 import pandas as pd
+import polars as pl
+from typing import Optional
 from src.infrastructure.database.repository import DatabaseRepository
 
 
+def _db_mtime(db_path: str) -> float:
+    """Last write time of the database (including a WAL file, if any)"""
+    paths = [db_path, f"{db_path}-wal"]
+    return max(os.path.getmtime(p) for p in paths if os.path.exists(p))
+
+
+@st.cache_data(ttl=60)
+def _schema_df(
+    _repo: DatabaseRepository, db_path: str, table: str, mtime: float
+) -> pd.DataFrame:
+    """Column schema of a table, cached until the database file changes"""
+    cols_info = _repo.get_table_schema(table)
+    schema_df = pd.DataFrame(
+        cols_info,
+        columns=["Index", "Column Name", "Type", "NotNull", "Default", "PK"],
+    )
+    return schema_df[["Index", "Column Name", "Type"]]
+
+
+@st.cache_data(ttl=60)
+def _preview_df(
+    _repo: DatabaseRepository, db_path: str, table: str, mtime: float
+) -> Optional[pl.DataFrame]:
+    """First 5 rows of a table, cached until the database file changes"""
+    return _repo.preview(table, 5)
+
+
 def render_schema_comparison(repo: DatabaseRepository):
     """Display schema (unchanged layout)."""
     st.subheader("📋 Schema Viewer")
@@ -23,6 +52,7 @@ def render_schema_comparison(repo: DatabaseRepository):
     if selected:
         info = repo.get_table_info(selected)
         if info:
+            mtime = _db_mtime(repo.db_path)
             col1, col2 = st.columns([3, 1])
             with col1:
                 st.markdown(f"**Table:** `{selected}`")
@@ -30,15 +60,7 @@ def render_schema_comparison(repo: DatabaseRepository):
             with col2:
                 st.metric("Rows", f"{info['row_count']:,}")
             st.markdown("#### Columns")
-            with sqlite3.connect(repo.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f"PRAGMA table_info({selected})")
-                cols_info = cursor.fetchall()
-            schema_df = pd.DataFrame(
-                cols_info,
-                columns=["Index", "Column Name", "Type", "NotNull", "Default", "PK"],
-            )
-            schema_df = schema_df[["Index", "Column Name", "Type"]]
+            schema_df = _schema_df(repo, repo.db_path, selected, mtime)
             text, inte, real = (
                 schema_df[schema_df["Type"] == "TEXT"],
                 schema_df[schema_df["Type"] == "INTEGER"],
@@ -67,9 +89,9 @@ def render_schema_comparison(repo: DatabaseRepository):
                     "No REAL columns"
                 )
             st.markdown("#### Sample Data (First 5 Rows)")
-            sample = repo.query(f"SELECT * FROM {selected} LIMIT 5")
+            sample = _preview_df(repo, repo.db_path, selected, mtime)
             if sample is not None and not sample.is_empty():
-                st.dataframe(sample.to_pandas(), height=200)
+                st.dataframe(sample, height=200)
             else:
                 st.info("No data available")
 
@@ -81,15 +103,7 @@ def render_column_search(repo: DatabaseRepository):
         "Search for column name", placeholder="e.g., Cell ID, UTRAN, etc."
     )
     if term:
-        results = []
-        for table in repo.get_all_tables():
-            info = repo.get_table_info(table)
-            if info:
-                matching = [
-                    col for col in info["columns"] if term.lower() in col.lower()
-                ]
-                if matching:
-                    results.append({"table": table, "columns": matching})
+        results = repo.search_columns(term)
         if results:
             st.success(f"Found in {len(results)} table(s)")
             for res in results:
@@ -2,15 +2,64 @@
 Configuration page for CSV import
 """
 
+import shutil
+import tempfile
+import polars as pl
 import streamlit as st
 from pathlib import Path
-from src.infrastructure.database.repository import DatabaseRepository
+from typing import Optional, Tuple
 from src.application.use_cases.import_csv_use_case import ImportCSVUseCase
+from src.presentation.components.resources import get_repository
 from src.presentation.components.schema_viewer import (
     render_schema_comparison,
     render_column_search,
 )
 
+# Chunk size for streaming uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Columns left untouched by the preview numeric cleanup
+PREVIEW_SKIP_COLUMNS = frozenset({"id", "imported_at"})
+
+# Seconds before cached table info is refreshed
+TABLE_INFO_TTL = 30
+
+
+@st.cache_resource
+def _get_import_uc() -> ImportCSVUseCase:
+    """Import use case shared across reruns"""
+    return ImportCSVUseCase(get_repository())
+
+
+@st.cache_data
+def _get_table_configs() -> dict:
+    """Static table import configurations"""
+    return _get_import_uc().get_all_table_configs()
+
+
+@st.cache_data(ttl=TABLE_INFO_TTL)
+def _cached_table_info(table_name: str) -> Optional[dict]:
+    """Table info for the Table Info panel"""
+    return get_repository().get_table_info(table_name)
+
+
+@st.cache_data(ttl=TABLE_INFO_TTL)
+def _cached_table_infos(table_names: Tuple[str, ...]) -> dict:
+    """Table infos for the Database Status grid"""
+    return get_repository().get_table_infos(list(table_names))
+
+
+def _save_upload(uploaded_file) -> str:
+    """
+    Stream uploaded file to a unique temp file in UPLOAD_CHUNK_SIZE chunks
+
+    Returns the temp file path; the caller is responsible for removing it.
+    """
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as f:
+        shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
+    return f.name
+
 
 def render():
     """Render the configuration page"""
@@ -18,11 +67,11 @@ def render():
     st.markdown("---")
 
     # Initialize use case (Dependency Injection)
-    repository = DatabaseRepository()
-    import_use_case = ImportCSVUseCase(repository)
+    repository = get_repository()
+    import_use_case = _get_import_uc()
 
     # Get all table configurations
-    table_configs = import_use_case.get_all_table_configs()
+    table_configs = _get_table_configs()
 
     # Display import interface
     st.subheader("Import CSV Files")
@@ -79,69 +128,62 @@ def render():
         if uploaded_file is not None:
             st.markdown("#### 📋 Data Preview")
 
-            # Save to temp file for preview
-            temp_preview_path = f"preview_{uploaded_file.name}"
-            with open(temp_preview_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-
             try:
-                # Read and preview with Polars
-                import polars as pl
-
-                df_preview = pl.read_csv(
-                    temp_preview_path,
+                # Read and preview with Polars straight from the upload buffer
+                uploaded_file.seek(0)
+                lf_preview = pl.scan_csv(
+                    uploaded_file,
                     infer_schema_length=0,
                     ignore_errors=True,
                     truncate_ragged_lines=True,
-                    n_rows=5,  # Only first 5 rows for preview
+                )
+                # First 5 rows and total row count in one collect_all call, so
+                # Polars can share the upload scan between both plans
+                df_preview, df_count = pl.collect_all(
+                    [lf_preview.head(5), lf_preview.select(pl.len())],
+                    engine="streaming",
                 )
 
-                # Clean for preview
-                for col in df_preview.columns:
-                    if col.lower() not in ["id", "imported_at"]:
-                        try:
-                            df_preview = df_preview.with_columns(
-                                [
-                                    pl.col(col)
-                                    .str.replace_all(",", "")
-                                    .str.strip_chars()
-                                    .cast(pl.Float64, strict=False)
-                                    .alias(col)
-                                ]
-                            )
-                        except:
-                            pass
-
-                st.dataframe(df_preview.to_pandas(), width="stretch")
-                st.caption(
-                    f"Showing first 5 rows. Total rows in file: {len(pl.read_csv(temp_preview_path, infer_schema_length=0))}"
+                # Clean for preview - all columns in one with_columns call
+                df_preview = df_preview.with_columns(
+                    [
+                        pl.col(col)
+                        .str.replace_all(",", "", literal=True)
+                        .str.strip_chars()
+                        .cast(pl.Float64, strict=False)
+                        for col in df_preview.columns
+                        if col.lower() not in PREVIEW_SKIP_COLUMNS
+                    ]
                 )
 
+                st.dataframe(df_preview, width="stretch")
+
+                total_rows = df_count.item()
+                st.caption(f"Showing first 5 rows. Total rows in file: {total_rows}")
+
             except Exception as e:
                 st.warning(f"Could not preview file: {str(e)}")
-            finally:
-                # Clean up preview file
-                Path(temp_preview_path).unlink(missing_ok=True)
 
         # Import button
         if st.button("🚀 Import Data", type="primary", width="stretch"):
             if uploaded_file is not None:
                 with st.spinner("Importing data..."):
                     # Save uploaded file temporarily
-                    temp_path = f"temp_{uploaded_file.name}"
-                    with open(temp_path, "wb") as f:
-                        f.write(uploaded_file.getbuffer())
-
-                    # Execute import
-                    success, message = import_use_case.execute(
-                        csv_path=temp_path, table_name=selected_table
-                    )
+                    temp_path = _save_upload(uploaded_file)
 
-                    # Clean up temp file
-                    Path(temp_path).unlink(missing_ok=True)
+                    try:
+                        # Execute import
+                        success, message = import_use_case.execute(
+                            csv_path=temp_path, table_name=selected_table
+                        )
+                    finally:
+                        # Clean up temp file
+                        Path(temp_path).unlink(missing_ok=True)
 
                     # Show result
                     if success:
+                        # Refresh cached table info / filters after new data
+                        st.cache_data.clear()
                         st.success(f"✅ {message}")
                     else:
                         st.error(f"❌ {message}")
@@ -151,7 +193,7 @@ def render():
     with col2:
         # Display table information
         st.subheader("Table Info")
-        table_info = repository.get_table_info(selected_table)
+        table_info = _cached_table_info(selected_table)
 
         if table_info:
             st.metric("Total Rows", table_info["row_count"])
@@ -167,11 +209,12 @@ def render():
     st.markdown("---")
     st.subheader("📊 Database Status")
 
-    # Create metrics for each table
+    # Create metrics for each table (one batched lookup for all tables)
+    table_infos = _cached_table_infos(tuple(table_configs))
     cols = st.columns(5)
     for idx, (table_name, config) in enumerate(table_configs.items()):
         with cols[idx]:
-            info = repository.get_table_info(table_name)
+            info = table_infos.get(table_name)
             row_count = info["row_count"] if info else 0
 
             # Color coding based on data availability
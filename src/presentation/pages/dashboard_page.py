@@ -5,22 +5,79 @@ Clean and effective version with Date Range filter
 
 import streamlit as st
 import polars as pl
-import pandas as pd
 from datetime import datetime, timedelta
-from src.infrastructure.database.repository import DatabaseRepository
+from typing import Dict, Iterator, Optional, Tuple
 from src.application.services.dashboard_service import DashboardService
+from src.presentation.components.resources import get_repository
 from src.application.services.coverage_map_service import render_coverage_map
 from src.application.services.ta_distribution_visualizer import TADistributionVisualizer
 
+# Seconds before the cached Managed Element list is refreshed
+MANAGED_ELEMENTS_TTL = 300
+
+# st.dataframe sizing for the compact SCOT table (pixels)
+TABLE_ROW_HEIGHT = 35
+TABLE_HEADER_HEIGHT = 38
+TABLE_MAX_HEIGHT = 400
+
+# Data sections rendered below the overview: (title, results key, expanded)
+DATA_SECTIONS = (
+    ("🔄 LTE Timing Advance Data (Augmented)", "timingadvance", False),
+    ("🔄 LTE Timing Advance Data (Non-Augmented)", "timingadvance_original", False),
+    ("1️⃣ GCell Data", "gcell", False),
+    ("2️⃣ SCOT Data (Full)", "scot", False),  # Full SCOT data (augmented)
+    ("3️⃣ Mapping Data", "mapping", False),
+    ("4️⃣ LTE Hourly Data", "ltehourly", True),
+    ("4️⃣b LTE Hourly Combined (with TA)", "ltehourly_combined", True),
+    ("5️⃣ 2G Hourly Data", "twoghourly", False),
+    ("6️⃣ GCell Coverage Data", "gcell_coverage", True),
+)
+
+# Summary table rows: (label, results key)
+SUMMARY_TABLES = (
+    ("LTE Timing Advance (Augmented)", "timingadvance"),
+    ("LTE Timing Advance (Original)", "timingadvance_original"),
+    ("GCell", "gcell"),
+    ("SCOT", "scot"),
+    ("Mapping", "mapping"),
+    ("LTE Hourly", "ltehourly"),
+    ("LTE Hourly Combined", "ltehourly_combined"),
+    ("2G Hourly", "twoghourly"),
+    ("GCell Coverage", "gcell_coverage"),
+)
+SUMMARY_LABELS, SUMMARY_KEYS = zip(*SUMMARY_TABLES)
+
+# Results filtered by the selected date range
+HOURLY_KEYS = frozenset({"ltehourly", "ltehourly_combined", "twoghourly"})
+
+# Display format for float columns in result tables
+FLOAT_FORMAT = "%.2f"
+
+
+@st.cache_resource
+def _get_dashboard_service() -> DashboardService:
+    """Dashboard service shared across reruns (on the app-wide repository)"""
+    return DashboardService(get_repository())
+
+
+@st.cache_resource(ttl=MANAGED_ELEMENTS_TTL, max_entries=1)
+def _get_managed_elements(data_version: Optional[float]) -> Tuple[str, ...]:
+    """
+    Managed Element filter options, refreshed when the database changes
+
+    Cached as a shared tuple (cache_resource) so a large TOWERID list is not
+    unpickled again on every rerun.
+    """
+    return tuple(_get_dashboard_service().get_managed_elements())
+
 
 def render():
     """Render the dashboard page"""
-    repository = DatabaseRepository()
-    dashboard_service = DashboardService(repository)
+    dashboard_service = _get_dashboard_service()
 
     st.sidebar.header("🔍 Filters")
     try:
-        managed_elements = dashboard_service.get_managed_elements()
+        managed_elements = _get_managed_elements(dashboard_service.get_data_version())
     except Exception as e:
         st.error(f"Error loading filters: {str(e)}")
         return
@@ -34,7 +91,7 @@ def render():
     # Filter 1: Select TOWERID
     selected_element = st.sidebar.selectbox(
         "TOWERID",
-        options=["All"] + managed_elements,
+        options=["All", *managed_elements],
         index=0,
         help="Filter data by Managed Element",
     )
@@ -76,13 +133,10 @@ def render():
     run_query = st.sidebar.button("▶️ Run Query", type="primary")
 
     if run_query and selected_element != "All":
-        with st.spinner("Running queries..."):
-            results = dashboard_service.execute_all_queries(
-                selected_element, start_date=start_datetime, end_date=end_datetime
-            )
-            _render_query_results(
-                results, selected_element, start_datetime, end_datetime
-            )
+        results = dashboard_service.iter_query_results(
+            selected_element, start_date=start_datetime, end_date=end_datetime
+        )
+        _render_query_results(results, selected_element, start_datetime, end_datetime)
     elif run_query:
         st.warning("⚠️ Please select a specific Managed Element to run queries")
     else:
@@ -95,15 +149,13 @@ def _get_scot_non_augmented(results: dict, managed_element: str):
     """
     Filter SCOT data untuk mendapatkan hanya data NON-AUGMENTED
     (hanya data yang SiteID = managed_element)
+
+    Filter, projection and sort run as one lazy plan, so only the
+    displayed columns of the matching rows are materialized.
     """
     df_scot = results.get("scot")
 
-    if df_scot is None or df_scot.is_empty():
-        return None
-
-    df_non_augmented = df_scot.filter(pl.col("SiteID") == managed_element)
-
-    if df_non_augmented.is_empty():
+    if df_scot is None:
         return None
 
     target_columns = [
@@ -117,31 +169,40 @@ def _get_scot_non_augmented(results: dict, managed_element: str):
         "Additional Tilt Recommendation",
     ]
 
-    available_columns = [
-        col for col in target_columns if col in df_non_augmented.columns
-    ]
+    column_set = set(df_scot.columns)
+    available_columns = [col for col in target_columns if col in column_set]
 
     if not available_columns:
         return None
 
-    if "Sectorid_v2" in available_columns:
-        df_sorted = df_non_augmented.select(available_columns).sort(
-            ["Sectorid_v2", "Cell_PI-1"]
-        )
-    else:
-        df_sorted = df_non_augmented.select(available_columns)
+    lf_non_augmented = (
+        df_scot.lazy()
+        .filter(pl.col("SiteID") == managed_element)
+        .select(available_columns)
+    )
+    if "Sectorid_v2" in column_set:
+        sort_columns = [
+            col for col in ("Sectorid_v2", "Cell_PI-1") if col in column_set
+        ]
+        lf_non_augmented = lf_non_augmented.sort(sort_columns)
+
+    df_non_augmented = lf_non_augmented.collect()
+    if df_non_augmented.height == 0:
+        return None
 
-    return df_sorted
+    return df_non_augmented
 
 
-def _render_ta_distribution_section(results: dict, managed_element: str):
+def _render_ta_distribution_section(
+    results: dict, row_counts: Dict[str, int], managed_element: str
+):
     """Render TA Distribution visualization section"""
-    df_timingadvance = results.get("timingadvance_original")
-
-    if df_timingadvance is None or df_timingadvance.is_empty():
+    if row_counts.get("timingadvance_original", 0) == 0:
         st.warning("⚠️ No Timing Advance data available for TA Distribution analysis")
         return
 
+    df_timingadvance = results["timingadvance_original"]
+
     distance_cols = [
         "0 - 78 m",
         "78 - 234 m",
@@ -181,7 +242,8 @@ def _render_ta_distribution_section(results: dict, managed_element: str):
     ]
 
     required_cols = ["Sector_Name", "Band"] + distance_cols + cdf_cols
-    missing_cols = [col for col in required_cols if col not in df_timingadvance.columns]
+    column_set = set(df_timingadvance.columns)
+    missing_cols = [col for col in required_cols if col not in column_set]
 
     if missing_cols:
         st.error(f"❌ Missing required columns: {missing_cols[:5]}...")
@@ -191,31 +253,36 @@ def _render_ta_distribution_section(results: dict, managed_element: str):
     visualizer.display_sector_charts_in_rows(df_timingadvance, managed_element)
 
 
-def _styled_dataframe(df, height: int = 400):
-    """Render dataframe dengan styling yang konsisten"""
-    st.markdown(
-        """
-        <style>
-        .stDataFrame table {
-            font-size: 12px !important;
-        }
-        .stDataFrame thead th {
-            background-color: #1f77b4 !important;
-            color: white !important;
-            font-weight: bold !important;
-        }
-        </style>
-    """,
-        unsafe_allow_html=True,
+def _column_config(df: pl.DataFrame) -> dict:
+    """Server-side number formatting for the float columns of a frame"""
+    return {
+        col: st.column_config.NumberColumn(format=FLOAT_FORMAT)
+        for col, dtype in df.schema.items()
+        if dtype.is_float()
+    }
+
+
+def _styled_dataframe(df: pl.DataFrame, height: int = 400):
+    """Render dataframe dengan styling yang konsisten (Polars passed directly)"""
+    st.dataframe(
+        df,
+        height=height,
+        width="stretch",
+        hide_index=True,
+        column_config=_column_config(df),
     )
 
-    st.dataframe(df, height=height, width="stretch", hide_index=True)
+
+def _row_count(df: Optional[pl.DataFrame]) -> int:
+    """Row count of a result frame (0 for a missing frame), computed once"""
+    return 0 if df is None else df.height
 
 
 def _render_data_section(
     title: str,
     results_key: str,
     results: dict,
+    row_counts: Dict[str, int],
     expanded: bool = False,
     height: int = 400,
     show_metrics: bool = False,
@@ -223,53 +290,83 @@ def _render_data_section(
     end_date: datetime = None,
 ):
     """Render a standardized data section"""
-    df = results.get(results_key)
+    row_count = row_counts.get(results_key, 0)
 
-    if df is None or df.is_empty():
+    if row_count == 0:
         st.info(f"No data found in {results_key}")
         return
 
+    df = results[results_key]
+
     # Show date range info for hourly data
     if results_key in ["ltehourly", "twoghourly"] and start_date and end_date:
         st.success(
-            f"✅ Found {len(df):,} records from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+            f"✅ Found {row_count:,} records from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
         )
     else:
-        st.success(f"✅ Found {len(df):,} records")
+        st.success(f"✅ Found {row_count:,} records")
 
     # Show eNodeBId info for Timing Advance
     if results_key == "timingadvance" and "eNodeBId" in df.columns:
-        enodeb_ids = df["eNodeBId"].unique().to_list()
+        # Only six distinct ids are needed: five to show, one to detect "more"
+        enodeb_ids = (
+            df.lazy()
+            .select(pl.col("eNodeBId").unique(maintain_order=True).head(6))
+            .collect()
+            .get_column("eNodeBId")
+        )
+        # Join the first few ids in Polars instead of formatting them in Python
+        enodeb_str = enodeb_ids.head(5).cast(pl.Utf8).str.join(", ").item()
         st.info(
-            f"**eNodeBId for LTE Hourly mapping:** {', '.join(map(str, enodeb_ids[:5]))}{'...' if len(enodeb_ids) > 5 else ''}"
+            f"**eNodeBId for LTE Hourly mapping:** {enodeb_str}{'...' if enodeb_ids.len() > 5 else ''}"
         )
 
     with st.expander(f"View {title}", expanded=expanded):
-        _styled_dataframe(df.to_pandas(), height)
+        _styled_dataframe(df, height)
 
 
-def _render_metrics_section(results: dict):
-    """Render key metrics for data sections"""
+def _mean_expr(df: pl.DataFrame, column: str) -> pl.Expr:
+    """Mean of a column (null for missing or text columns, like Series.mean)"""
+    dtype = df.schema.get(column)
+    if dtype is None or not dtype.is_numeric():
+        return pl.lit(None, dtype=pl.Float64)
+    return pl.col(column).mean()
+
+
+def _render_metrics_section(results: dict, row_counts: Dict[str, int]):
+    """
+    Render key metrics for data sections
+
+    All metrics of a frame are computed in a single select.
+    """
     df_timingadvance = results.get("timingadvance")
     df_coverage = results.get("gcell_coverage")
 
-    if df_timingadvance is not None and not df_timingadvance.is_empty():
-        if "TA90" in df_timingadvance.columns:
+    if row_counts.get("timingadvance", 0) > 0:
+        if "TA90" in set(df_timingadvance.columns):
+            unique_ta, avg_ta = df_timingadvance.select(
+                pl.col("TA90").n_unique().alias("unique"),
+                _mean_expr(df_timingadvance, "TA90").alias("mean"),
+            ).row(0)
             col1, col2 = st.columns(2)
             with col1:
-                unique_ta = df_timingadvance["TA90"].n_unique()
                 st.metric("Unique TA90 Values", unique_ta)
             with col2:
-                avg_ta = df_timingadvance["TA90"].mean()
                 st.metric(
                     "Avg TA90 Value", f"{avg_ta:.2f}" if avg_ta is not None else "N/A"
                 )
 
-    if df_coverage is not None and not df_coverage.is_empty():
+    if row_counts.get("gcell_coverage", 0) > 0:
+        coverage_cols = set(df_coverage.columns)
+        avg_ta90, unique_cells = df_coverage.select(
+            _mean_expr(df_coverage, "TA90").alias("mean"),
+            pl.col("CellName").n_unique().alias("cells")
+            if "CellName" in coverage_cols
+            else pl.lit(0).alias("cells"),
+        ).row(0)
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            if "TA90" in df_coverage.columns:
-                avg_ta90 = df_coverage["TA90"].mean()
+            if "TA90" in coverage_cols:
                 st.metric(
                     "Avg TA90", f"{avg_ta90:.2f}" if avg_ta90 is not None else "N/A"
                 )
@@ -279,129 +376,95 @@ def _render_metrics_section(results: dict):
             # avg_distance = df_coverage["Min of S2S Distance"].mean()
             # st.metric("Avg S2S Distance", f"{avg_distance:.2f}")
         with col3:
-            st.metric("Total Columns", len(df_coverage.columns))
+            st.metric("Total Columns", len(coverage_cols))
         with col4:
-            unique_cells = (
-                df_coverage["CellName"].n_unique()
-                if "CellName" in df_coverage.columns
-                else 0
-            )
             st.metric("Unique Cells", unique_cells)
 
 
-def _styled_table(df):
-    """Render table dengan styling yang konsisten untuk SCOT data"""
-    st.markdown(
-        """
-        <style>
-        .small-table table {
-            font-size: 12px !important;
-            width: 100% !important;
-        }
-        .small-table thead th {
-            background-color: #1f77b4 !important;
-            color: white !important;
-            font-weight: bold !important;
-            font-size: 11px !important;
-            padding: 8px 4px !important;
-        }
-        .small-table tbody td {
-            padding: 6px 4px !important;
-            font-size: 11px !important;
-        }
-        </style>
-    """,
-        unsafe_allow_html=True,
-    )
+def _table_height(n_rows: int) -> int:
+    """Table height that fits n_rows, capped at TABLE_MAX_HEIGHT"""
+    return min(TABLE_MAX_HEIGHT, TABLE_ROW_HEIGHT * n_rows + TABLE_HEADER_HEIGHT)
 
-    pandas_df = df.to_pandas()
 
+def _styled_table(df: pl.DataFrame):
+    """Render table dengan styling yang konsisten untuk SCOT data"""
     st.dataframe(
-        pandas_df,
+        df,
         width="stretch",
         hide_index=True,
-        height=min(400, 35 * len(pandas_df) + 38),
+        height=_table_height(df.height),
+        column_config=_column_config(df),
     )
 
 
-def _render_summary_section(results: dict, start_date: datetime, end_date: datetime):
+def _render_summary_section(
+    row_counts: Dict[str, int], start_date: datetime, end_date: datetime
+):
     """Render summary section dengan styling"""
-    tables = {
-        "LTE Timing Advance (Augmented)": "timingadvance",
-        "LTE Timing Advance (Original)": "timingadvance_original",
-        "GCell": "gcell",
-        "SCOT": "scot",
-        "Mapping": "mapping",
-        "LTE Hourly": "ltehourly",
-        "LTE Hourly Combined": "ltehourly_combined",
-        "2G Hourly": "twoghourly",
-        "GCell Coverage": "gcell_coverage",
-    }
-
-    summary_data = []
-    for table_name, results_key in tables.items():
-        df = results.get(results_key)
-        record_count = len(df) if df is not None and not df.is_empty() else 0
-        status = "✅ Found" if record_count > 0 else "❌ Empty"
-
-        # Add date range info for hourly data
-        if (
-            results_key in ["ltehourly", "ltehourly_combined", "twoghourly"]
-            and record_count > 0
-        ):
-            date_info = f" ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')})"
-            table_name += date_info
-
-        summary_data.append(
-            {"Table": table_name, "Records Found": record_count, "Status": status}
-        )
-
-    summary_df = pd.DataFrame(summary_data)
-    st.markdown(
-        """
-        <style>
-        .summary-table table {
-            font-size: 8px !important;
-        }
-        .summary-table thead th {
-            background-color: #2E86AB !important;
-            color: white !important;
-            font-weight: bold !important;
+    # Date range info for hourly data, formatted once
+    date_info = (
+        f" ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')})"
+    )
+    counts = [row_counts.get(key, 0) for key in SUMMARY_KEYS]
+
+    summary_df = pl.DataFrame(
+        {
+            "Table": [
+                label + date_info if key in HOURLY_KEYS and count > 0 else label
+                for label, key, count in zip(SUMMARY_LABELS, SUMMARY_KEYS, counts)
+            ],
+            "Records Found": counts,
+            "Status": ["✅ Found" if count > 0 else "❌ Empty" for count in counts],
         }
-        </style>
-    """,
-        unsafe_allow_html=True,
     )
-
     st.dataframe(summary_df, width="stretch", hide_index=True)
 
 
 def _render_query_results(
-    results: dict, managed_element: str, start_date: datetime, end_date: datetime
+    query_results: Iterator[Tuple[str, Optional[pl.DataFrame]]],
+    managed_element: str,
+    start_date: datetime,
+    end_date: datetime,
 ):
-    """Render all query results in organized sections"""
-    st.markdown(
-        """
-        <style>
-        /* Global table styling */
-        .stDataFrame table {
-            font-size: 8px !important;
-        }
-        .stDataFrame thead th {
-            background-color: #1f77b4 !important;
-            color: white !important;
-            font-weight: bold !important;
-            font-size: 8px !important;
-        }
-        .stDataFrame tbody td {
-            font-size: 8px !important;
-        }
-        </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+    Render all query results in organized sections
 
-    col1, col2 = st.columns([2, 1])
+    Data sections get placeholders up front and are filled as each query
+    finishes; the overview, metrics and summary need every result and are
+    rendered last.
+    """
+    overview = st.container()
+
+    slots = {}
+    for title, key, _ in DATA_SECTIONS:
+        st.markdown("---")
+        st.subheader(title)
+        slots[key] = st.empty()
+        slots[key].caption("⏳ Running query...")
+
+    section_options = {key: (title, expanded) for title, key, expanded in DATA_SECTIONS}
+    results = {}
+    row_counts = {}
+
+    with st.spinner("Running queries..."):
+        for key, df in query_results:
+            results[key] = df
+            row_counts[key] = _row_count(df)
+
+            if key in slots:
+                title, expanded = section_options[key]
+                with slots[key].container():
+                    _render_data_section(
+                        title,
+                        key,
+                        results,
+                        row_counts,
+                        expanded,
+                        start_date=start_date,
+                        end_date=end_date,
+                    )
+
+    col1, col2 = overview.columns([2, 1])
 
     with col1:
         st.markdown("### 🌎 Map Overview")
@@ -419,45 +482,19 @@ def _render_query_results(
         with col1:
             container = st.container(border=True)
             with container:
-                st.markdown("")
-                st.markdown("")
-                st.markdown("")
-                st.markdown("")
-                st.markdown("")
-                st.markdown("")
-                st.markdown("")
-                st.markdown("")
+                for _ in range(8):
+                    st.markdown("")
 
     with col2:
         st.markdown("### 📍 TA Distributions")
-        _render_ta_distribution_section(results, managed_element)
-
-    # Data sections
-    sections = [
-        ("🔄 LTE Timing Advance Data (Augmented)", "timingadvance", False),
-        ("🔄 LTE Timing Advance Data (Non-Augmented)", "timingadvance_original", False),
-        ("1️⃣ GCell Data", "gcell", False),
-        ("2️⃣ SCOT Data (Full)", "scot", False),  # Full SCOT data (augmented)
-        ("3️⃣ Mapping Data", "mapping", False),
-        ("4️⃣ LTE Hourly Data", "ltehourly", True),
-        ("4️⃣b LTE Hourly Combined (with TA)", "ltehourly_combined", True),
-        ("5️⃣ 2G Hourly Data", "twoghourly", False),
-        ("6️⃣ GCell Coverage Data", "gcell_coverage", True),
-    ]
-
-    for title, key, expanded in sections:
-        st.markdown("---")
-        st.subheader(title)
-        _render_data_section(
-            title, key, results, expanded, start_date=start_date, end_date=end_date
-        )
+        _render_ta_distribution_section(results, row_counts, managed_element)
 
     # Metrics section
     st.markdown("---")
     st.subheader("📊 Key Metrics")
-    _render_metrics_section(results)
+    _render_metrics_section(results, row_counts)
 
     # Summary section
     st.markdown("---")
     st.subheader("📈 Summary")
-    _render_summary_section(results, start_date, end_date)
+    _render_summary_section(row_counts, start_date, end_date)
@@ -5,8 +5,11 @@ UPDATED: Fixed TA queries with MAX date condition and ambiguous column errors
 ============================================================================
 """
 
-from typing import List
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
 import polars as pl
 import logging
 from src.config.settings import Settings
@@ -16,143 +19,430 @@ from src.utils.process.date_normalizer import DateNormalizer
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Characters stripped from text metrics before the Float64 cast, in one
+# regex pass: thousand separators, quotes, percent signs and whitespace
+METRIC_NOISE_PATTERN = r'[,"%\s]+'
+
+# Settings is immutable, so every repository instance shares one copy
+_SETTINGS = Settings()
+
+# LTE cell_id -> (sector, band)
+CELL_ID_MAPPING = {
+    # 850 MHz
+    131: ("1", "850"),
+    132: ("2", "850"),
+    133: ("3", "850"),
+    134: ("4", "850"),
+    # 1800 MHz
+    4: ("1", "1800"),
+    5: ("2", "1800"),
+    6: ("3", "1800"),
+    24: ("4", "1800"),
+    51: ("11", "1800"),
+    52: ("12", "1800"),
+    53: ("13", "1800"),
+    54: ("14", "1800"),
+    55: ("15", "1800"),
+    56: ("16", "1800"),
+    14: ("M1", "1800"),
+    15: ("M2", "1800"),
+    16: ("M3", "1800"),
+    64: ("M4", "1800"),
+    # 2100 MHz
+    1: ("1", "2100"),
+    2: ("2", "2100"),
+    3: ("3", "2100"),
+    7: ("1", "2100"),
+    8: ("2", "2100"),
+    9: ("3", "2100"),
+    27: ("4", "2100"),
+    91: ("11", "2100"),
+    92: ("12", "2100"),
+    93: ("13", "2100"),
+    94: ("14", "2100"),
+    95: ("15", "2100"),
+    96: ("16", "2100"),
+    97: ("11", "2100"),
+    17: ("M1", "2100"),
+    18: ("M2", "2100"),
+    19: ("M3", "2100"),
+    67: ("M4", "2100"),
+    # 2300 F1
+    111: ("1", "2300F1"),
+    112: ("2", "2300F1"),
+    113: ("3", "2300F1"),
+    114: ("4", "2300F1"),
+    141: ("11", "2300F1"),
+    142: ("12", "2300F1"),
+    143: ("13", "2300F1"),
+    144: ("14", "2300F1"),
+    145: ("15", "2300F1"),
+    146: ("16", "2300F1"),
+    # 2300 F2
+    121: ("1", "2300F2"),
+    122: ("2", "2300F2"),
+    123: ("3", "2300F2"),
+    124: ("4", "2300F2"),
+    151: ("11", "2300F2"),
+    152: ("12", "2300F2"),
+    153: ("13", "2300F2"),
+    154: ("14", "2300F2"),
+    155: ("15", "2300F2"),
+    156: ("16", "2300F2"),
+}
+
+# Every sector the mapping can yield, in lexical order so Enum sorts match
+# the former Utf8 column
+SECTOR_VALUES = sorted({sector for sector, _ in CELL_ID_MAPPING.values()} | {"Unknown"})
+SECTOR_DTYPE = pl.Enum(SECTOR_VALUES)
+
+# Mapped cell_ids, for unmapped-row diagnostics
+_MAPPED_CELL_IDS = list(CELL_ID_MAPPING)
+
+# First mapped cell_ids, quoted in the all-Unknown error log
+_EXPECTED_CELL_IDS_PREVIEW = _MAPPED_CELL_IDS[:20]
+
+_CELL_MAPPING_DF = pl.DataFrame(
+    {
+        "cell_id": list(CELL_ID_MAPPING),
+        "sector": [sector for sector, _ in CELL_ID_MAPPING.values()],
+        "band": [band for _, band in CELL_ID_MAPPING.values()],
+    },
+    schema={"cell_id": pl.Int64, "sector": SECTOR_DTYPE, "band": pl.Utf8},
+)
+
+
+# Columns selected by fetch_ta_distribution_data (TA distribution visualizer)
+_TA_DIST_COLS = (
+    "newta_towerid_sector",
+    "newta_sector_name",
+    "newta_band",
+    "newta_ta90",
+    "newta_ta99",
+    "newta_total",
+    "newta_0_78_m",
+    "newta_78_234_m",
+    "newta_234_390_m",
+    "newta_390_546_m",
+    "newta_546_702_m",
+    "newta_702_858_m",
+    "newta_858_1014_m",
+    "newta_1014_1560_m",
+    "newta_1560_2106_m",
+    "newta_2106_2652_m",
+    "newta_2652_3120_m",
+    "newta_3120_3900_m",
+    "newta_3900_6318_m",
+    "newta_6318_10062_m",
+    "newta_10062_13962_m",
+    "newta_13962_20000_m",
+    "newta_78",
+    "newta_234",
+    "newta_390",
+    "newta_546",
+    "newta_702",
+    "newta_858",
+    "newta_1014",
+    "newta_1560",
+    "newta_2106",
+    "newta_2652",
+    "newta_3120",
+    "newta_3900",
+    "newta_6318",
+    "newta_10062",
+    "newta_13962",
+    "newta_20000",
+)
+
+# TA distribution query (latest date per tower), built once at import;
+# {tower_filter} appears twice, so its params are bound twice
+_TA_DIST_TEMPLATE = f"""
+        SELECT DISTINCT
+            {", ".join(f"t.{col}" for col in _TA_DIST_COLS)},
+            t.{{date_col}} as newta_date,
+            t.{{tower_col}} as newta_managed_element
+        FROM {{table}} t
+        WHERE t.{{tower_col}} IN (
+            SELECT sub.{{tower_col}}
+            FROM {{table}} sub
+            WHERE {{tower_filter}}
+        )
+        AND t.{{date_col}} = (
+            SELECT MAX(sub2.{{date_col}})
+            FROM {{table}} sub2
+            WHERE sub2.{{tower_col}} = t.{{tower_col}}
+        )
+        AND {{tower_filter}}
+        ORDER BY t.newta_sector_name, t.newta_band
+        """
+
+
+@lru_cache(maxsize=256)
+def _fmt_mdy(ordinal: int) -> str:
+    """MM/DD/YYYY string for a date ordinal (memoized)"""
+    return date.fromordinal(ordinal).strftime("%m/%d/%Y")
+
+
+@lru_cache(maxsize=1024)
+def _date_filter_flexible(
+    start_ordinal: int, end_ordinal: int, column: str
+) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Memoized flexible date filter keyed on (start, end, column)
+
+    The same window is reused by every fetch of a dashboard request, so the
+    date strings are formatted (and logged) once per distinct window.
+    """
+    start_ymd = date.fromordinal(start_ordinal).isoformat()
+    end_ymd = date.fromordinal(end_ordinal).isoformat()
+
+    filter_str = f"({column} BETWEEN ? AND ? OR {column} BETWEEN ? AND ?)"
+    params = (_fmt_mdy(start_ordinal), _fmt_mdy(end_ordinal), start_ymd, end_ymd)
+
+    logger.info("Flexible date filter: %s %s", filter_str, params)
+    return filter_str, params
+
 
 class DataRepository:
     """Repository for analytics data access with date normalization"""
 
     def __init__(self, db_path: str):
+        self._db_path = db_path
         self._query_builder = QueryBuilder(db_path)
-        self._settings = Settings()
-        self._date_normalizer = DateNormalizer()
-
-    def _format_date(self, date: datetime) -> str:
-        """Format datetime to string for SQL"""
-        return date.strftime("%m/%d/%Y")
-
-    def _build_tower_filter(self, tower_ids: List[str], column: str) -> str:
-        """Build SQL filter for tower IDs"""
-        if not tower_ids:
-            return "1=0"
-
-        ids_str_list = [str(tower_id) for tower_id in tower_ids]
-        ids_str = "', '".join(ids_str_list)
-        return f"{column} IN ('{ids_str}')"
+        self._settings = _SETTINGS
+
+        # Empty results per SQL text, served when no tower IDs are given;
+        # dropped when the database mtime changes so schemas stay current
+        self._empty_frames: Dict[str, pl.DataFrame] = {}
+        self._empty_frames_mtime: Optional[float] = None
+
+    def _db_mtime(self) -> Optional[float]:
+        """Last write time of the database (including a WAL file, if any)"""
+        paths = [self._db_path, f"{self._db_path}-wal"]
+        mtimes = [os.path.getmtime(p) for p in paths if os.path.exists(p)]
+        return max(mtimes) if mtimes else None
+
+    def _build_tower_filter(
+        self, tower_ids: List[str], column: str
+    ) -> Tuple[str, List[str]]:
+        """Build parameterized SQL filter for tower IDs -> (sql, params)"""
+        n = len(tower_ids)
+        if n == 0:
+            return "1=0", []
+        if n == 1:
+            # Common single-tower dashboard case: plain equality
+            return f"{column} = ?", [str(tower_ids[0])]
+
+        placeholders = ", ".join("?" * n)
+        return f"{column} IN ({placeholders})", [str(t) for t in tower_ids]
 
     def _build_date_filter_flexible(
         self, start_date: datetime, end_date: datetime, column: str
-    ) -> str:
+    ) -> Tuple[str, List[str]]:
         """
         Build flexible date filter that handles multiple formats
-        """
-        start_mdy = self._format_date(start_date)
-        end_mdy = self._format_date(end_date)
 
-        start_ymd = start_date.strftime("%Y-%m-%d")
-        end_ymd = end_date.strftime("%Y-%m-%d")
-
-        filter_str = (
-            f"({column} BETWEEN '{start_mdy}' AND '{end_mdy}' OR "
-            f"{column} BETWEEN '{start_ymd}' AND '{end_ymd}')"
+        Returns a parameterized (sql, params) pair
+        """
+        filter_str, params = _date_filter_flexible(
+            start_date.toordinal(), end_date.toordinal(), column
         )
+        return filter_str, list(params)
 
-        logger.info(f"Flexible date filter: {filter_str}")
-        return filter_str
+    def _read(self, query: str, params: List, tower_ids: List[str]) -> pl.DataFrame:
+        """
+        Run a tower-filtered query as a Polars DataFrame
 
-    def _normalize_dates_in_df(self, df: pl.DataFrame, date_col: str) -> pl.DataFrame:
+        Without tower IDs the filter is always false, so the (empty) result is
+        read once per query text and database version and served from memory
+        afterwards.
         """
-        Normalize mixed date formats in DataFrame after fetch
+        if tower_ids:
+            return self._query_builder.to_dataframe(query, params, engine="polars")
+
+        mtime = self._db_mtime()
+        if mtime != self._empty_frames_mtime:
+            self._empty_frames.clear()
+            self._empty_frames_mtime = mtime
+
+        empty = self._empty_frames.get(query)
+        if empty is None:
+            empty = self._query_builder.to_dataframe(query, params, engine="polars")
+            self._empty_frames[query] = empty
+        return empty.clone()
+
+    def _fetch_concurrently(
+        self, tower_ids: List[str], *queries: Tuple[str, List]
+    ) -> List[pl.DataFrame]:
         """
-        if df.is_empty() or date_col not in df.columns:
-            return df
+        Run independent (query, params) pairs in parallel threads
+
+        QueryBuilder opens a separate SQLite connection per call, so the reads
+        proceed concurrently and wall time is that of the slowest query.
+        """
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = [
+                executor.submit(self._read, query, params, tower_ids)
+                for query, params in queries
+            ]
+            return [future.result() for future in futures]
 
-        df = self._date_normalizer.normalize_date_column(
-            df, date_col, output_col=f"{date_col}_normalized"
+    def _normalized_date_column(self, date_col: str, prefix: str = "") -> str:
+        """
+        SQL select item projecting date_col as MM/DD/YYYY into {date_col}_clean
+
+        Parses the two common stored formats (YYYY-MM-DD and M/D/YYYY) inside
+        SQLite, rejecting impossible dates via a julianday round trip. Other
+        formats come out NULL and are filled by _fill_unparsed_dates.
+        """
+        col = f"{prefix}{date_col}"
+        iso = (
+            f"(CASE WHEN {col} LIKE '____-__-__%' THEN substr({col}, 1, 10) "
+            f"WHEN {col} LIKE '%/%/____' THEN printf('%04d-%02d-%02d', "
+            f"CAST(substr({col}, -4) AS INTEGER), "
+            f"CAST({col} AS INTEGER), "
+            f"CAST(substr({col}, instr({col}, '/') + 1) AS INTEGER)) END)"
+        )
+        return (
+            f"CASE WHEN date(julianday({iso})) = {iso} "
+            f"THEN strftime('%m/%d/%Y', {iso}) END AS {date_col}_clean"
         )
 
-        if f"{date_col}_normalized" in df.columns:
-            df = df.with_columns(
-                pl.col(f"{date_col}_normalized")
-                .dt.strftime("%m/%d/%Y")
-                .alias(f"{date_col}_clean")
-            )
+    def _fill_unparsed_dates(self, df: pl.DataFrame, date_col: str) -> pl.DataFrame:
+        """
+        Fill {date_col}_clean for rows the SQL expression could not parse
 
-        return df
+        Tries DateNormalizer.SUPPORTED_FORMATS in order (e.g. M/D/YY, D/M/YYYY,
+        YYYYMMDD), matching the former post-fetch normalization. Skipped when
+        SQLite parsed every non-null date.
+        """
+        clean_col = f"{date_col}_clean"
+        if clean_col not in df.columns or date_col not in df.columns:
+            return df
+
+        unparsed = pl.col(clean_col).is_null() & pl.col(date_col).is_not_null()
+        if not df.select(unparsed.any()).item():
+            return df
+
+        raw = pl.col(date_col).cast(pl.Utf8)
+        parsed = pl.coalesce(
+            [
+                raw.str.strptime(pl.Date, fmt, strict=False)
+                for fmt in DateNormalizer.SUPPORTED_FORMATS
+            ]
+        )
+        return df.with_columns(
+            pl.col(clean_col).cast(pl.Utf8).fill_null(parsed.dt.strftime("%m/%d/%Y"))
+        )
 
     def fetch_wd_data(
         self, tower_ids: List[str], start_date: datetime, end_date: datetime
     ) -> pl.DataFrame:
-        """Fetch Weekday data with date normalization"""
+        """
+        Fetch Weekday data with date normalization
+
+        Rows are sorted by date and tower in Polars after the fetch.
+        """
         table = self._settings.TABLE_WD
         tower_col = self._settings.TOWERID_COLUMNS[table]
         date_col = self._settings.DATE_COLUMNS[table]
 
-        where = f"{self._build_tower_filter(tower_ids, tower_col)} AND {self._build_date_filter_flexible(start_date, end_date, date_col)}"
-        logger.info(f"WD Query WHERE: {where}")
+        tower_filter, tower_params = self._build_tower_filter(tower_ids, tower_col)
+        date_filter, date_params = self._build_date_filter_flexible(
+            start_date, end_date, date_col
+        )
+        where = f"{tower_filter} AND {date_filter}"
+        params = tower_params + date_params
+        logger.info("WD Query WHERE: %s", where)
 
         query = self._query_builder.select(
-            table=table, where=where, order_by=f"{date_col}, {tower_col}"
+            table=table,
+            columns=["*", self._normalized_date_column(date_col)],
+            where=where,
         )
 
-        df = self._query_builder.to_dataframe(query, engine="polars")
-        logger.info(f"WD Data fetched (before date normalization): {len(df)} rows")
-
-        if not df.is_empty():
-            df = self._normalize_dates_in_df(df, date_col)
-            logger.info(f"WD Data after normalization: {len(df)} rows")
+        df = self._fill_unparsed_dates(self._read(query, params, tower_ids), date_col)
+        df = df.sort([date_col, tower_col])
+        logger.info("WD Data fetched: %s rows", df.height)
 
         return df
 
     def fetch_bh_data(
         self, tower_ids: List[str], start_date: datetime, end_date: datetime
     ) -> pl.DataFrame:
-        """Fetch Busy Hour data with date normalization"""
+        """
+        Fetch Busy Hour data with date normalization
+
+        Rows are sorted by date and tower in Polars after the fetch.
+        """
         table = self._settings.TABLE_BH
         tower_col = self._settings.TOWERID_COLUMNS[table]
         date_col = self._settings.DATE_COLUMNS[table]
 
-        where = f"{self._build_tower_filter(tower_ids, tower_col)} AND {self._build_date_filter_flexible(start_date, end_date, date_col)}"
-        logger.info(f"BH Query WHERE: {where}")
+        tower_filter, tower_params = self._build_tower_filter(tower_ids, tower_col)
+        date_filter, date_params = self._build_date_filter_flexible(
+            start_date, end_date, date_col
+        )
+        where = f"{tower_filter} AND {date_filter}"
+        params = tower_params + date_params
+        logger.info("BH Query WHERE: %s", where)
 
         query = self._query_builder.select(
-            table=table, where=where, order_by=f"{date_col}, {tower_col}"
+            table=table,
+            columns=["*", self._normalized_date_column(date_col)],
+            where=where,
         )
 
-        df = self._query_builder.to_dataframe(query, engine="polars")
-        logger.info(f"BH Data fetched: {len(df)} rows")
-
-        if not df.is_empty():
-            df = self._normalize_dates_in_df(df, date_col)
+        df = self._fill_unparsed_dates(self._read(query, params, tower_ids), date_col)
+        df = df.sort([date_col, tower_col])
+        logger.info("BH Data fetched: %s rows", df.height)
 
         return df
 
     def fetch_twog_data(
         self, tower_ids: List[str], start_date: datetime, end_date: datetime
     ) -> pl.DataFrame:
-        """Fetch 2G data with date normalization"""
+        """
+        Fetch 2G data with date normalization
+
+        Rows are sorted by date and tower in Polars after the fetch.
+        """
         table = self._settings.TABLE_TWOG
         tower_col = self._settings.TOWERID_COLUMNS[table]
         date_col = self._settings.DATE_COLUMNS[table]
 
-        where = f"{self._build_tower_filter(tower_ids, tower_col)} AND {self._build_date_filter_flexible(start_date, end_date, date_col)}"
-        logger.info(f"2G Query WHERE: {where}")
+        tower_filter, tower_params = self._build_tower_filter(tower_ids, tower_col)
+        date_filter, date_params = self._build_date_filter_flexible(
+            start_date, end_date, date_col
+        )
+        where = f"{tower_filter} AND {date_filter}"
+        params = tower_params + date_params
+        logger.info("2G Query WHERE: %s", where)
 
         query = self._query_builder.select(
-            table=table, where=where, order_by=f"{date_col}, {tower_col}"
+            table=table,
+            columns=["*", self._normalized_date_column(date_col)],
+            where=where,
         )
 
-        df = self._query_builder.to_dataframe(query, engine="polars")
-        logger.info(f"2G Data fetched: {len(df)} rows")
+        df = self._fill_unparsed_dates(self._read(query, params, tower_ids), date_col)
+        df = df.sort([date_col, tower_col])
+        n = df.height
+        logger.info("2G Data fetched: %s rows", n)
 
-        if not df.is_empty():
-            df = self._normalize_dates_in_df(df, date_col)
-            logger.info(f"2G Columns: {df.columns}")
+        if n:
+            logger.debug("2G Columns: %s", df.columns)
 
         return df
 
     def fetch_joined_ta_wd(
         self, tower_ids: List[str], start_date: datetime, end_date: datetime
     ) -> pl.DataFrame:
-        """Fetch joined WD + TA with date normalization"""
+        """
+        Fetch joined WD + TA with date normalization
+
+        Rows are sorted by date and tower in Polars after the fetch.
+        """
         ta_table = self._settings.TABLE_TA
         wd_table = self._settings.TABLE_WD
 
@@ -162,12 +452,13 @@ class DataRepository:
         wd_join_col = "newwd_moentity"
         ta_join_col = "newta_eutrancell"
 
-        tower_filter = self._build_tower_filter(tower_ids, wd_tower_col)
-        date_filter = self._build_date_filter_flexible(
+        tower_filter, tower_params = self._build_tower_filter(tower_ids, wd_tower_col)
+        date_filter, date_params = self._build_date_filter_flexible(
             start_date, end_date, wd_date_col
         )
 
         where = f"{tower_filter} AND {date_filter}"
+        params = tower_params + date_params
 
         join_query = f"""
         SELECT 
@@ -175,27 +466,30 @@ class DataRepository:
             t.newta_sector,
             t.newta_sector_name, 
             t.newta_enodebid,
-            t.newta_cellid
+            t.newta_cellid,
+            {self._normalized_date_column(wd_date_col, "w.")}
         FROM {wd_table} w
         LEFT JOIN {ta_table} t ON w.{wd_join_col} = t.{ta_join_col}
         WHERE {where}
-        ORDER BY w.{wd_date_col}, w.{wd_tower_col}
         """
 
-        logger.info(f"Joined WD+TA Query: {join_query}")
-
-        df = self._query_builder.to_dataframe(join_query, engine="polars")
-        logger.info(f"Joined WD+TA Data fetched: {len(df)} rows")
-
-        if not df.is_empty():
-            df = self._normalize_dates_in_df(df, wd_date_col)
+        logger.info("Joined WD+TA Query: %s", join_query)
 
+        df = self._fill_unparsed_dates(
+            self._read(join_query, params, tower_ids), wd_date_col
+        )
+        df = df.sort([wd_date_col, wd_tower_col])
+        logger.info("Joined WD+TA Data fetched: %s rows", df.height)
         return df
 
     def fetch_joined_ta_bh(
         self, tower_ids: List[str], start_date: datetime, end_date: datetime
     ) -> pl.DataFrame:
-        """Fetch joined BH + TA with date normalization"""
+        """
+        Fetch joined BH + TA with date normalization
+
+        Rows are sorted by date and tower in Polars after the fetch.
+        """
         ta_table = self._settings.TABLE_TA
         bh_table = self._settings.TABLE_BH
 
@@ -205,12 +499,13 @@ class DataRepository:
         bh_join_col = "newbh_moentity"
         ta_join_col = "newta_eutrancell"
 
-        tower_filter = self._build_tower_filter(tower_ids, bh_tower_col)
-        date_filter = self._build_date_filter_flexible(
+        tower_filter, tower_params = self._build_tower_filter(tower_ids, bh_tower_col)
+        date_filter, date_params = self._build_date_filter_flexible(
             start_date, end_date, bh_date_col
         )
 
         where = f"{tower_filter} AND {date_filter}"
+        params = tower_params + date_params
 
         join_query = f"""
         SELECT 
@@ -218,21 +513,20 @@ class DataRepository:
             t.newta_sector,
             t.newta_sector_name, 
             t.newta_enodebid,
-            t.newta_cellid
+            t.newta_cellid,
+            {self._normalized_date_column(bh_date_col, "b.")}
         FROM {bh_table} b
         LEFT JOIN {ta_table} t ON b.{bh_join_col} = t.{ta_join_col}
         WHERE {where}
-        ORDER BY b.{bh_date_col}, b.{bh_tower_col}
         """
 
-        logger.info(f"Joined BH+TA Query: {join_query}")
-
-        df = self._query_builder.to_dataframe(join_query, engine="polars")
-        logger.info(f"Joined BH+TA Data fetched: {len(df)} rows")
-
-        if not df.is_empty():
-            df = self._normalize_dates_in_df(df, bh_date_col)
+        logger.info("Joined BH+TA Query: %s", join_query)
 
+        df = self._fill_unparsed_dates(
+            self._read(join_query, params, tower_ids), bh_date_col
+        )
+        df = df.sort([bh_date_col, bh_tower_col])
+        logger.info("Joined BH+TA Data fetched: %s rows", df.height)
         return df
 
     def fetch_ta_data_all(self, tower_ids: List[str]) -> pl.DataFrame:
@@ -244,7 +538,7 @@ class DataRepository:
         tower_col = self._settings.TOWERID_COLUMNS[table]
         date_col = self._settings.DATE_COLUMNS[table]
 
-        tower_filter = self._build_tower_filter(tower_ids, tower_col)
+        tower_filter, tower_params = self._build_tower_filter(tower_ids, tower_col)
 
         # Query with correlated subquery to get max date per tower
         query = f"""
@@ -264,20 +558,23 @@ class DataRepository:
         ORDER BY t.{tower_col}, t.newta_sector
         """
 
-        logger.info(f"TA MAX DATE Query")
-        df = self._query_builder.to_dataframe(query, engine="polars")
-        logger.info(f"TA Data fetched (latest date per tower): {len(df)} rows")
+        logger.info("TA MAX DATE Query")
+        # tower_filter appears twice in the query, so bind its params twice
+        df = self._read(query, tower_params * 2, tower_ids)
+        n = df.height
+        logger.info("TA Data fetched (latest date per tower): %s rows", n)
 
-        if not df.is_empty() and date_col in df.columns:
-            unique_dates = df.select(pl.col(date_col).n_unique()).item()
+        if n and logger.isEnabledFor(logging.DEBUG) and date_col in df.columns:
             date_range = df.select(
-                [
-                    pl.col(date_col).min().alias("min_date"),
-                    pl.col(date_col).max().alias("max_date"),
-                ]
-            ).to_dicts()[0]
-            logger.info(
-                f"TA Date range: {date_range['min_date']} to {date_range['max_date']} ({unique_dates} unique dates)"
+                pl.col(date_col).min().alias("min_date"),
+                pl.col(date_col).max().alias("max_date"),
+                pl.col(date_col).n_unique().alias("unique_dates"),
+            ).row(0, named=True)
+            logger.debug(
+                "TA Date range: %s to %s (%s unique dates)",
+                date_range["min_date"],
+                date_range["max_date"],
+                date_range["unique_dates"],
             )
 
         return df
@@ -291,7 +588,7 @@ class DataRepository:
         tower_col = self._settings.TOWERID_COLUMNS[table]
         date_col = self._settings.DATE_COLUMNS[table]
 
-        tower_filter = self._build_tower_filter(tower_ids, tower_col)
+        tower_filter, tower_params = self._build_tower_filter(tower_ids, tower_col)
 
         # Query with correlated subquery to get max date per tower
         query = f"""
@@ -311,20 +608,23 @@ class DataRepository:
         ORDER BY k.{tower_col}
         """
 
-        logger.info(f"KQI MAX DATE Query")
-        df = self._query_builder.to_dataframe(query, engine="polars")
-        logger.info(f"KQI Data fetched (latest date per tower): {len(df)} rows")
+        logger.info("KQI MAX DATE Query")
+        # tower_filter appears twice in the query, so bind its params twice
+        df = self._read(query, tower_params * 2, tower_ids)
+        n = df.height
+        logger.info("KQI Data fetched (latest date per tower): %s rows", n)
 
-        if not df.is_empty() and date_col in df.columns:
-            unique_dates = df.select(pl.col(date_col).n_unique()).item()
+        if n and logger.isEnabledFor(logging.DEBUG) and date_col in df.columns:
             date_range = df.select(
-                [
-                    pl.col(date_col).min().alias("min_date"),
-                    pl.col(date_col).max().alias("max_date"),
-                ]
-            ).to_dicts()[0]
-            logger.info(
-                f"KQI Date range: {date_range['min_date']} to {date_range['max_date']} ({unique_dates} unique dates)"
+                pl.col(date_col).min().alias("min_date"),
+                pl.col(date_col).max().alias("max_date"),
+                pl.col(date_col).n_unique().alias("unique_dates"),
+            ).row(0, named=True)
+            logger.debug(
+                "KQI Date range: %s to %s (%s unique dates)",
+                date_range["min_date"],
+                date_range["max_date"],
+                date_range["unique_dates"],
             )
 
         return df
@@ -334,13 +634,16 @@ class DataRepository:
         table = self._settings.TABLE_SCOT
         tower_cols = self._settings.TOWERID_COLUMNS[table]
 
-        where = f"({self._build_tower_filter(tower_ids, tower_cols[0])} OR {self._build_tower_filter(tower_ids, tower_cols[1])})"
-        logger.info(f"SCOT Query WHERE: {where}")
+        # Same IDs for both columns: cast once, bind twice
+        filter_a, params = self._build_tower_filter(tower_ids, tower_cols[0])
+        filter_b = self._build_tower_filter(params, tower_cols[1])[0]
+        where = f"({filter_a} OR {filter_b})"
+        logger.info("SCOT Query WHERE: %s", where)
 
         query = self._query_builder.select(table=table, where=where)
 
-        df = self._query_builder.to_dataframe(query, engine="polars")
-        logger.info(f"SCOT Data fetched: {len(df)} rows")
+        df = self._read(query, params * 2, tower_ids)
+        logger.info("SCOT Data fetched: %s rows", df.height)
         return df
 
     def fetch_gcell_data(self, tower_ids: List[str]) -> pl.DataFrame:
@@ -348,13 +651,13 @@ class DataRepository:
         table = self._settings.TABLE_GCELL
         tower_col = self._settings.TOWERID_COLUMNS[table]
 
-        where = self._build_tower_filter(tower_ids, tower_col)
-        logger.info(f"GCELL Query WHERE: {where}")
+        where, params = self._build_tower_filter(tower_ids, tower_col)
+        logger.info("GCELL Query WHERE: %s", where)
 
         query = self._query_builder.select(table=table, where=where)
 
-        df = self._query_builder.to_dataframe(query, engine="polars")
-        logger.info(f"GCELL Data fetched: {len(df)} rows")
+        df = self._read(query, params, tower_ids)
+        logger.info("GCELL Data fetched: %s rows", df.height)
         return df
 
     def fetch_joined_gcell_scot_ta(self, tower_ids: List[str]) -> pl.DataFrame:
@@ -367,7 +670,9 @@ class DataRepository:
         ta_date_col = self._settings.DATE_COLUMNS[ta_table]
 
         gcell_tower_col = self._settings.TOWERID_COLUMNS[gcell_table]
-        tower_filter = self._build_tower_filter(tower_ids, gcell_tower_col)
+        tower_filter, tower_params = self._build_tower_filter(
+            tower_ids, gcell_tower_col
+        )
 
         join_query = f"""
         SELECT 
@@ -405,16 +710,17 @@ class DataRepository:
         ORDER BY g.{gcell_tower_col}, g.moentity
         """
 
-        logger.info(f"Joined GCELL+SCOT+TA Query (with MAX TA date)")
+        logger.info("Joined GCELL+SCOT+TA Query (with MAX TA date)")
 
-        df = self._query_builder.to_dataframe(join_query, engine="polars")
-        logger.info(f"Joined GCELL+SCOT+TA Data fetched: {len(df)} rows")
+        df = self._read(join_query, tower_params, tower_ids)
+        n = df.height
+        logger.info("Joined GCELL+SCOT+TA Data fetched: %s rows", n)
 
-        if not df.is_empty():
+        if n and logger.isEnabledFor(logging.DEBUG):
             sample = df.head(3).select(
                 ["moentity", "new_tower_id", "newta_sector_name", "newta_date"]
             )
-            logger.info(f"Sample joined data:\n{sample}")
+            logger.debug("Sample joined data:\n%s", sample)
 
         return df
 
@@ -427,47 +733,24 @@ class DataRepository:
         tower_col = self._settings.TOWERID_COLUMNS[table]
         date_col = self._settings.DATE_COLUMNS[table]
 
-        tower_filter = self._build_tower_filter(tower_ids, tower_col)
+        tower_filter, tower_params = self._build_tower_filter(tower_ids, tower_col)
 
-        query = f"""
-        SELECT DISTINCT
-            t.newta_towerid_sector,
-            t.newta_sector_name,
-            t.newta_band,
-            t.newta_ta90,
-            t.newta_ta99,
-            t.newta_total,
-            t.newta_0_78_m, t.newta_78_234_m, t.newta_234_390_m, t.newta_390_546_m,
-            t.newta_546_702_m, t.newta_702_858_m, t.newta_858_1014_m, t.newta_1014_1560_m,
-            t.newta_1560_2106_m, t.newta_2106_2652_m, t.newta_2652_3120_m, t.newta_3120_3900_m,
-            t.newta_3900_6318_m, t.newta_6318_10062_m, t.newta_10062_13962_m, t.newta_13962_20000_m,
-            t.newta_78, t.newta_234, t.newta_390, t.newta_546, t.newta_702, t.newta_858,
-            t.newta_1014, t.newta_1560, t.newta_2106, t.newta_2652, t.newta_3120, t.newta_3900,
-            t.newta_6318, t.newta_10062, t.newta_13962, t.newta_20000,
-            t.{date_col} as newta_date,
-            t.{tower_col} as newta_managed_element
-        FROM {table} t
-        WHERE t.{tower_col} IN (
-            SELECT sub.{tower_col}
-            FROM {table} sub
-            WHERE {tower_filter}
-        )
-        AND t.{date_col} = (
-            SELECT MAX(sub2.{date_col})
-            FROM {table} sub2
-            WHERE sub2.{tower_col} = t.{tower_col}
+        query = _TA_DIST_TEMPLATE.format(
+            table=table,
+            tower_col=tower_col,
+            date_col=date_col,
+            tower_filter=tower_filter,
         )
-        AND {tower_filter}
-        ORDER BY t.newta_sector_name, t.newta_band
-        """
 
-        logger.info(f"TA Distribution MAX DATE Query (with explicit columns)")
-        df = self._query_builder.to_dataframe(query, engine="polars")
-        logger.info(f"TA Distribution Data fetched (latest date): {len(df)} rows")
+        logger.info("TA Distribution MAX DATE Query (with explicit columns)")
+        # tower_filter appears twice in the query, so bind its params twice
+        df = self._read(query, tower_params * 2, tower_ids)
+        n = df.height
+        logger.info("TA Distribution Data fetched (latest date): %s rows", n)
 
-        if not df.is_empty() and "newta_date" in df.columns:
+        if n and "newta_date" in df.columns:
             unique_dates = df.select(pl.col("newta_date").n_unique()).item()
-            logger.info(f"TA Distribution unique dates: {unique_dates}")
+            logger.info("TA Distribution unique dates: %s", unique_dates)
 
         return df
 
@@ -482,14 +765,17 @@ class DataRepository:
         wd_date_col = self._settings.DATE_COLUMNS[wd_table]
         ta_tower_col = self._settings.TOWERID_COLUMNS[ta_table]
 
-        wd_tower_filter = self._build_tower_filter(tower_ids, wd_tower_col)
-        wd_date_filter = self._build_date_filter_flexible(
+        wd_tower_filter, wd_tower_params = self._build_tower_filter(
+            tower_ids, wd_tower_col
+        )
+        wd_date_filter, wd_date_params = self._build_date_filter_flexible(
             start_date, end_date, wd_date_col
         )
-        ta_tower_filter = self._build_tower_filter(tower_ids, ta_tower_col)
+        ta_tower_filter, ta_params = self._build_tower_filter(tower_ids, ta_tower_col)
 
         wd_query = f"""
-        SELECT * FROM {wd_table}
+        SELECT *, {self._normalized_date_column(wd_date_col)}
+        FROM {wd_table}
         WHERE {wd_tower_filter} AND {wd_date_filter}
         ORDER BY {wd_date_col}, {wd_tower_col}
         """
@@ -499,18 +785,19 @@ class DataRepository:
         WHERE {ta_tower_filter}
         """
 
-        logger.info(f"WD Separate Query: {wd_query}")
-        logger.info(f"TA Separate Query: {ta_query}")
+        logger.info("WD Separate Query: %s", wd_query)
+        logger.info("TA Separate Query: %s", ta_query)
 
-        df_wd = self._query_builder.to_dataframe(wd_query, engine="polars")
-        df_ta = self._query_builder.to_dataframe(ta_query, engine="polars")
-
-        logger.info(f"WD Separate Data fetched: {len(df_wd)} rows")
-        logger.info(f"TA Separate Data fetched: {len(df_ta)} rows")
+        df_wd, df_ta = self._fetch_concurrently(
+            tower_ids,
+            (wd_query, wd_tower_params + wd_date_params),
+            (ta_query, ta_params),
+        )
 
-        if not df_wd.is_empty():
-            df_wd = self._normalize_dates_in_df(df_wd, wd_date_col)
+        df_wd = self._fill_unparsed_dates(df_wd, wd_date_col)
 
+        logger.info("WD Separate Data fetched: %s rows", df_wd.height)
+        logger.info("TA Separate Data fetched: %s rows", df_ta.height)
         return df_wd, df_ta
 
     def fetch_bh_ta_separate(
@@ -524,14 +811,17 @@ class DataRepository:
         bh_date_col = self._settings.DATE_COLUMNS[bh_table]
         ta_tower_col = self._settings.TOWERID_COLUMNS[ta_table]
 
-        bh_tower_filter = self._build_tower_filter(tower_ids, bh_tower_col)
-        bh_date_filter = self._build_date_filter_flexible(
+        bh_tower_filter, bh_tower_params = self._build_tower_filter(
+            tower_ids, bh_tower_col
+        )
+        bh_date_filter, bh_date_params = self._build_date_filter_flexible(
             start_date, end_date, bh_date_col
         )
-        ta_tower_filter = self._build_tower_filter(tower_ids, ta_tower_col)
+        ta_tower_filter, ta_params = self._build_tower_filter(tower_ids, ta_tower_col)
 
         bh_query = f"""
-        SELECT * FROM {bh_table}
+        SELECT *, {self._normalized_date_column(bh_date_col)}
+        FROM {bh_table}
         WHERE {bh_tower_filter} AND {bh_date_filter}
         ORDER BY {bh_date_col}, {bh_tower_col}
         """
@@ -541,18 +831,19 @@ class DataRepository:
         WHERE {ta_tower_filter}
         """
 
-        logger.info(f"BH Separate Query: {bh_query}")
-        logger.info(f"TA Separate Query: {ta_query}")
+        logger.info("BH Separate Query: %s", bh_query)
+        logger.info("TA Separate Query: %s", ta_query)
 
-        df_bh = self._query_builder.to_dataframe(bh_query, engine="polars")
-        df_ta = self._query_builder.to_dataframe(ta_query, engine="polars")
-
-        logger.info(f"BH Separate Data fetched: {len(df_bh)} rows")
-        logger.info(f"TA Separate Data fetched: {len(df_ta)} rows")
+        df_bh, df_ta = self._fetch_concurrently(
+            tower_ids,
+            (bh_query, bh_tower_params + bh_date_params),
+            (ta_query, ta_params),
+        )
 
-        if not df_bh.is_empty():
-            df_bh = self._normalize_dates_in_df(df_bh, bh_date_col)
+        df_bh = self._fill_unparsed_dates(df_bh, bh_date_col)
 
+        logger.info("BH Separate Data fetched: %s rows", df_bh.height)
+        logger.info("TA Separate Data fetched: %s rows", df_ta.height)
         return df_bh, df_ta
 
     def _extract_clean_tower_id(self, df: pl.DataFrame) -> pl.DataFrame:
@@ -563,24 +854,18 @@ class DataRepository:
         if "lte_hour_me_name" not in df.columns:
             return df
 
+        # Single pass: extract "#...#" and fall back to the full name
         df = df.with_columns(
-            [
-                pl.col("lte_hour_me_name")
-                .str.extract(r"#([^#]+)#")
-                .alias("clean_tower_id")
-            ]
-        )
-
-        df = df.with_columns(
-            [
-                pl.when(pl.col("clean_tower_id").is_null())
-                .then(pl.col("lte_hour_me_name"))
-                .otherwise(pl.col("clean_tower_id"))
-                .alias("clean_tower_id")
-            ]
+            pl.col("lte_hour_me_name")
+            .str.extract(r"#([^#]+)#", 1)
+            .fill_null(pl.col("lte_hour_me_name"))
+            .alias("clean_tower_id")
         )
 
-        logger.info(f"🏗️ Clean tower IDs: {df['clean_tower_id'].unique().to_list()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🏗️ Clean tower IDs: %s", df["clean_tower_id"].unique().to_list()
+            )
         return df
 
     def fetch_lte_hourly_data(
@@ -597,80 +882,63 @@ class DataRepository:
         tower_col = self._settings.TOWERID_COLUMNS[table]
         date_col = self._settings.DATE_COLUMNS[table]
 
-        logger.info(f"🔄 Fetching LTE Hourly data for towers: {tower_ids}")
+        logger.info("🔄 Fetching LTE Hourly data for towers: %s", tower_ids)
 
         if not tower_ids:
             logger.warning("❌ No tower IDs provided")
             return pl.DataFrame()
 
-        # Build WHERE clause
-        tower_conditions = []
-        for tid in tower_ids:
-            tower_conditions.append(f"{tower_col} LIKE '%#{tid}#%'")
-            tower_conditions.append(f"{tower_col} LIKE '%{tid}%'")
-
+        # Build WHERE clause - one case-insensitive LIKE probe per tower
+        # (a "#tid#" match is always also a "tid" match, so one check suffices)
+        tower_conditions = [f"{tower_col} LIKE ?"] * len(tower_ids)
         where = f"({' OR '.join(tower_conditions)})"
+        params = [f"%{tid}%" for tid in tower_ids]
 
         if start_date and end_date:
-            start_str = start_date.strftime("%Y-%m-%d 00:00:00")
-            end_str = end_date.strftime("%Y-%m-%d 23:59:59")
-            date_filter = f"{date_col} BETWEEN '{start_str}' AND '{end_str}'"
-            where = f"{where} AND {date_filter}"
+            where = f"{where} AND {date_col} BETWEEN ? AND ?"
+            params += [
+                start_date.strftime("%Y-%m-%d 00:00:00"),
+                end_date.strftime("%Y-%m-%d 23:59:59"),
+            ]
 
-        logger.info(f"🔍 WHERE clause: {where}")
+        logger.info("🔍 WHERE clause: %s %s", where, params)
 
         query = (
             f"SELECT * FROM {table} WHERE {where} ORDER BY {date_col}, lte_hour_cell_id"
         )
 
         try:
-            import sqlite3
+            # Direct Polars read over the SQLite connector (bypasses pandas)
+            df = self._query_builder.to_dataframe(query, params, engine="polars")
+            n = df.height
+            logger.info("✅ Polars read successful: %s rows", n)
 
-            # ===== METHOD 1: Direct Polars Read (Preferred) =====
-            # This bypasses pandas entirely and reads directly with Polars
-            conn_uri = f"sqlite:///{self._query_builder.db_path}"
-
-            try:
-                logger.info("🚀 Attempting direct Polars read_database...")
-                df = pl.read_database(query, connection=conn_uri)
-                logger.info(f"✅ Direct Polars read successful: {len(df)} rows")
-
-            except Exception as e:
-                logger.warning(f"⚠️ Direct Polars read failed: {e}")
-                logger.info("🔄 Falling back to SQLite connector...")
-
-                # ===== METHOD 2: Using SQLite Connector =====
-                conn = sqlite3.connect(self._query_builder.db_path)
-                df = pl.read_database(query, connection=conn)
-                conn.close()
-                logger.info(f"✅ SQLite connector read successful: {len(df)} rows")
-
-            if df.is_empty():
+            if n == 0:
                 logger.warning("⚠️ No data returned from query")
                 return pl.DataFrame()
 
             # Log sample data
-            if len(df) > 0:
+            if logger.isEnabledFor(logging.DEBUG):
                 sample_cols = (
                     [tower_col, "lte_hour_cell_id"]
                     if tower_col in df.columns
                     else df.columns[:3]
                 )
-                logger.info(f"📝 Sample data:\n{df.select(sample_cols).head(3)}")
+                logger.debug("📝 Sample data:\n%s", df.select(sample_cols).head(3))
 
             # Process the data
             df = self._cleanse_lte_hourly_data(df)
             df = self._add_sector_band_mapping(df)
             df = self._extract_clean_tower_id(df)
 
-            logger.info(f"🎯 Final data: {len(df)} rows, columns: {len(df.columns)}")
+            logger.info("🎯 Final data: %s rows, columns: %s", df.height, df.width)
             return df
 
         except Exception as e:
-            logger.error(f"❌ Error fetching LTE Hourly data: {e}")
+            logger.error("❌ Error fetching LTE Hourly data: %s", e)
             import traceback
 
-            logger.error(f"🔍 Stack trace:\n{traceback.format_exc()}")
+            logger.error("🔍 Stack trace:\n%s", traceback.format_exc())
             return pl.DataFrame()
 
     def _cleanse_lte_hourly_data(self, df: pl.DataFrame) -> pl.DataFrame:
@@ -683,28 +951,9 @@ class DataRepository:
 
         logger.info("🧹 Starting data cleansing...")
 
-        # ===== 1. Parse Datetime Columns =====
+        # ===== 1. Define Column Categories =====
         datetime_cols = ["lte_hour_begin_time", "lte_hour_end_time"]
-        for col in datetime_cols:
-            if col not in df.columns:
-                continue
-
-            try:
-                if df[col].dtype == pl.Datetime:
-                    logger.debug(f"✅ {col} already datetime")
-                    continue
-
-                df = df.with_columns(
-                    pl.col(col)
-                    .str.strptime(pl.Datetime, "%Y-%m-%d %H:%M:%S", strict=False)
-                    .alias(col)
-                )
-                logger.debug(f"✅ Parsed {col} to datetime")
-
-            except Exception as e:
-                logger.warning(f"⚠️ Could not parse {col}: {e}")
 
-        # ===== 2. Define Column Categories =====
         # Text columns - keep as string
         text_columns = [
             "lte_hour_granularity",
@@ -727,80 +976,64 @@ class DataRepository:
             "lte_hour_lte_id",
         ]
 
-        exclude_from_conversion = datetime_cols + text_columns + integer_id_columns
+        exclude_from_conversion = set(datetime_cols + text_columns + integer_id_columns)
 
-        # ===== 3. Handle Integer ID Columns - Keep as Int64 =====
-        logger.info(f"🔑 Processing {len(integer_id_columns)} ID columns as Int64...")
-        for col in integer_id_columns:
-            if col not in df.columns:
-                continue
-
-            try:
-                if df[col].dtype in [pl.Int64, pl.Int32]:
-                    # Already integer, keep it
-                    df = df.with_columns(
-                        pl.col(col).cast(pl.Int64, strict=False).alias(col)
-                    )
-                    logger.debug(f"✅ {col} kept as Int64")
+        # ===== 2. Build one cast expression per column from the schema =====
+        schema = df.schema
+        exprs = []
 
-                elif df[col].dtype == pl.Float64:
-                    # Convert float to int (handles 131.0 → 131)
-                    df = df.with_columns(
-                        pl.col(col).cast(pl.Int64, strict=False).alias(col)
-                    )
-                    logger.debug(f"✅ {col} converted Float64 → Int64")
-
-                elif df[col].dtype == pl.Utf8:
-                    # String to int
-                    df = df.with_columns(
-                        pl.col(col)
-                        .str.strip_chars()
-                        .cast(pl.Int64, strict=False)
-                        .alias(col)
+        # Datetime columns stored as text
+        for col in datetime_cols:
+            if schema.get(col) == pl.Utf8:
+                exprs.append(
+                    pl.col(col).str.strptime(
+                        pl.Datetime, "%Y-%m-%d %H:%M:%S", strict=False
                     )
-                    logger.debug(f"✅ {col} converted String → Int64")
+                )
 
-            except Exception as e:
-                logger.warning(f"⚠️ Could not process ID column {col}: {e}")
+        # ID columns -> Int64 (handles 131.0 -> 131 and padded strings)
+        for col in integer_id_columns:
+            dtype = schema.get(col)
+            if dtype in (pl.Int64, pl.Int32, pl.Float64):
+                exprs.append(pl.col(col).cast(pl.Int64, strict=False))
+            elif dtype == pl.Utf8:
+                exprs.append(pl.col(col).str.strip_chars().cast(pl.Int64, strict=False))
 
-        # ===== 4. Convert Metric Columns to Float64 =====
+        # Metric columns -> Float64 (strip commas, quotes, percent signs)
         metric_cols = [col for col in df.columns if col not in exclude_from_conversion]
-
-        logger.info(f"🔢 Converting {len(metric_cols)} metric columns to Float64...")
-
         for col in metric_cols:
-            try:
-                if df[col].dtype in [pl.Int64, pl.Float64]:
-                    df = df.with_columns(
-                        pl.col(col).cast(pl.Float64, strict=False).alias(col)
-                    )
-
-                elif df[col].dtype == pl.Utf8:
-                    # Clean string metrics (remove commas, quotes, etc.)
-                    df = df.with_columns(
-                        pl.col(col)
-                        .str.replace_all(",", "")
-                        .str.replace_all('"', "")
-                        .str.replace_all("%", "")
-                        .str.strip_chars()
-                        .cast(pl.Float64, strict=False)
-                        .alias(col)
-                    )
+            dtype = schema[col]
+            if dtype in (pl.Int64, pl.Float64):
+                exprs.append(pl.col(col).cast(pl.Float64, strict=False))
+            elif dtype == pl.Utf8:
+                exprs.append(
+                    pl.col(col)
+                    .str.replace_all(METRIC_NOISE_PATTERN, "")
+                    .cast(pl.Float64, strict=False)
+                )
 
-            except Exception as e:
-                logger.debug(f"⚠️ Could not convert {col}: {e}")
-                df = df.with_columns(pl.lit(None).cast(pl.Float64).alias(col))
+        # ===== 3. Apply all casts in a single fused pass =====
+        logger.info(
+            "🔢 Casting %s columns (%s metric candidates) in one pass...",
+            len(exprs),
+            len(metric_cols),
+        )
+        df = df.lazy().with_columns(exprs).collect()
 
-        # ===== 5. Verify cell_id is Int64 =====
+        # ===== 4. Verify cell_id is Int64 =====
         if "lte_hour_cell_id" in df.columns:
-            cell_dtype = df["lte_hour_cell_id"].dtype
-            sample_cells = (
-                df.select("lte_hour_cell_id").unique().sort("lte_hour_cell_id").head(10)
-            )
-            logger.info(f"✅ lte_hour_cell_id dtype: {cell_dtype}")
-            logger.info(
-                f"✅ Sample cell_ids: {sample_cells['lte_hour_cell_id'].to_list()}"
-            )
+            logger.info("✅ lte_hour_cell_id dtype: %s", df["lte_hour_cell_id"].dtype)
+            if logger.isEnabledFor(logging.DEBUG):
+                sample_cells = (
+                    df.select("lte_hour_cell_id")
+                    .unique()
+                    .sort("lte_hour_cell_id")
+                    .head(10)
+                )
+                logger.debug(
+                    "✅ Sample cell_ids: %s",
+                    sample_cells["lte_hour_cell_id"].to_list(),
+                )
 
         logger.info("✅ Data cleansing complete")
         return df
@@ -818,11 +1051,11 @@ class DataRepository:
 
         # Verify cell_id is Int64
         cell_dtype = df["lte_hour_cell_id"].dtype
-        logger.info(f"🔍 Cell_id dtype: {cell_dtype}")
+        logger.info("🔍 Cell_id dtype: %s", cell_dtype)
 
         if cell_dtype != pl.Int64:
             logger.warning(
-                f"⚠️ Expected Int64, got {cell_dtype}. Attempting conversion..."
+                "⚠️ Expected Int64, got %s. Attempting conversion...", cell_dtype
             )
             df = df.with_columns(
                 pl.col("lte_hour_cell_id")
@@ -831,129 +1064,68 @@ class DataRepository:
             )
 
         # Sample values for debugging
-        sample_cells = (
-            df.select("lte_hour_cell_id").unique().sort("lte_hour_cell_id").head(10)
-        )
-        logger.info(
-            f"🔍 Sample cell_id values: {sample_cells['lte_hour_cell_id'].to_list()}"
-        )
-
-        # Define the mapping
-        CELL_ID_MAPPING = {
-            # 850 MHz
-            131: ("1", "850"),
-            132: ("2", "850"),
-            133: ("3", "850"),
-            134: ("4", "850"),
-            # 1800 MHz
-            4: ("1", "1800"),
-            5: ("2", "1800"),
-            6: ("3", "1800"),
-            24: ("4", "1800"),
-            51: ("11", "1800"),
-            52: ("12", "1800"),
-            53: ("13", "1800"),
-            54: ("14", "1800"),
-            55: ("15", "1800"),
-            56: ("16", "1800"),
-            14: ("M1", "1800"),
-            15: ("M2", "1800"),
-            16: ("M3", "1800"),
-            64: ("M4", "1800"),
-            # 2100 MHz
-            1: ("1", "2100"),
-            2: ("2", "2100"),
-            3: ("3", "2100"),
-            7: ("1", "2100"),
-            8: ("2", "2100"),
-            9: ("3", "2100"),
-            27: ("4", "2100"),
-            91: ("11", "2100"),
-            92: ("12", "2100"),
-            93: ("13", "2100"),
-            94: ("14", "2100"),
-            95: ("15", "2100"),
-            96: ("16", "2100"),
-            97: ("11", "2100"),
-            17: ("M1", "2100"),
-            18: ("M2", "2100"),
-            19: ("M3", "2100"),
-            67: ("M4", "2100"),
-            # 2300 F1
-            111: ("1", "2300F1"),
-            112: ("2", "2300F1"),
-            113: ("3", "2300F1"),
-            114: ("4", "2300F1"),
-            141: ("11", "2300F1"),
-            142: ("12", "2300F1"),
-            143: ("13", "2300F1"),
-            144: ("14", "2300F1"),
-            145: ("15", "2300F1"),
-            146: ("16", "2300F1"),
-            # 2300 F2
-            121: ("1", "2300F2"),
-            122: ("2", "2300F2"),
-            123: ("3", "2300F2"),
-            124: ("4", "2300F2"),
-            151: ("11", "2300F2"),
-            152: ("12", "2300F2"),
-            153: ("13", "2300F2"),
-            154: ("14", "2300F2"),
-            155: ("15", "2300F2"),
-            156: ("16", "2300F2"),
-        }
-
-        # Build mapping expressions - direct comparison with Int64
-        sector_expr = pl.lit("Unknown")
-        band_expr = pl.lit("Unknown")
-
-        for cell_id, (sector, band) in CELL_ID_MAPPING.items():
-            sector_expr = (
-                pl.when(pl.col("lte_hour_cell_id") == cell_id)
-                .then(pl.lit(sector))
-                .otherwise(sector_expr)
+        if logger.isEnabledFor(logging.DEBUG):
+            sample_cells = (
+                df.select("lte_hour_cell_id").unique().sort("lte_hour_cell_id").head(10)
             )
-            band_expr = (
-                pl.when(pl.col("lte_hour_cell_id") == cell_id)
-                .then(pl.lit(band))
-                .otherwise(band_expr)
+            logger.debug(
+                "🔍 Sample cell_id values: %s",
+                sample_cells["lte_hour_cell_id"].to_list(),
             )
 
-        # Apply mapping
-        df = df.with_columns([sector_expr.alias("sector"), band_expr.alias("band")])
+        # Apply mapping - one hash join against the static cell_id table
+        df = df.drop(["sector", "band"], strict=False).join(
+            _CELL_MAPPING_DF,
+            left_on="lte_hour_cell_id",
+            right_on="cell_id",
+            how="left",
+            maintain_order="left",
+        )
+        df = df.with_columns(
+            [pl.col("sector").fill_null("Unknown"), pl.col("band").fill_null("Unknown")]
+        )
 
-        # Log results with detail
-        sector_counts = df.group_by("sector").agg(pl.count()).sort("sector")
-        band_counts = df.group_by("band").agg(pl.count()).sort("band")
+        # Everything below only feeds logs; skip the extra pass when the
+        # mapping outcome would not be reported at any level
+        if not logger.isEnabledFor(logging.ERROR):
+            return df
 
-        logger.info(f"📊 Sector mapping: {sector_counts.to_dicts()}")
-        logger.info(f"📡 Band mapping: {band_counts.to_dicts()}")
+        # Unknown diagnostics: row count and unmapped cell_ids in one pass,
+        # testing the Int64 cell_id against the mapping keys (no string compare)
+        lf = df.lazy()
+        unmapped = (
+            pl.col("lte_hour_cell_id").is_in(_MAPPED_CELL_IDS).fill_null(False).not_()
+        )
+        unknown_lf = lf.filter(unmapped).select(
+            pl.len(),
+            pl.col("lte_hour_cell_id").unique().sort().implode(),
+        )
 
-        # Warn if all Unknown
-        unknown_count = df.filter(pl.col("sector") == "Unknown").height
-        if unknown_count == len(df):
-            logger.error(f"❌ ALL {len(df)} records mapped to Unknown!")
-            unique_cells = (
-                df.select("lte_hour_cell_id").unique().sort("lte_hour_cell_id")
-            )
-            logger.error(
-                f"❌ Unique cell_ids in data: {unique_cells['lte_hour_cell_id'].to_list()}"
-            )
-            logger.error(
-                f"❌ Expected cell_ids: {list(CELL_ID_MAPPING.keys())[:20]}..."
+        # Log results with detail - debug counts are collected together with
+        # the diagnostics so the mapped frame is scanned once
+        if logger.isEnabledFor(logging.DEBUG):
+            unknown_df, sector_counts, band_counts = pl.collect_all(
+                [
+                    unknown_lf,
+                    lf.group_by("sector").agg(pl.len()).sort("sector"),
+                    lf.group_by("band").agg(pl.len()).sort("band"),
+                ]
             )
+            logger.debug("📊 Sector mapping: %s", sector_counts.to_dicts())
+            logger.debug("📡 Band mapping: %s", band_counts.to_dicts())
+        else:
+            unknown_df = unknown_lf.collect()
+
+        unknown_count, unknown_cells = unknown_df.row(0)
+        n = df.height
+        if unknown_count == n:
+            logger.error("❌ ALL %s records mapped to Unknown!", n)
+            logger.error("❌ Unique cell_ids in data: %s", unknown_cells)
+            logger.error("❌ Expected cell_ids: %s...", _EXPECTED_CELL_IDS_PREVIEW)
         elif unknown_count > 0:
-            logger.warning(f"⚠️ {unknown_count} records have Unknown sector/band")
-            unknown_cells = (
-                df.filter(pl.col("sector") == "Unknown")
-                .select("lte_hour_cell_id")
-                .unique()
-                .sort("lte_hour_cell_id")
-            )
-            logger.warning(
-                f"⚠️ Unmapped cell_ids: {unknown_cells['lte_hour_cell_id'].to_list()}"
-            )
+            logger.warning("⚠️ %s records have Unknown sector/band", unknown_count)
+            logger.warning("⚠️ Unmapped cell_ids: %s", unknown_cells)
         else:
-            logger.info(f"✅ All {len(df)} records successfully mapped!")
+            logger.info("✅ All %s records successfully mapped!", n)
 
         return df
@@ -6,6 +6,8 @@ Single Responsibility: Database queries for tower data
 ============================================================================
 """
 
+import os
+from typing import Optional, Tuple
 import polars as pl
 from src.config.settings import Settings
 from src.utils.process.query_builder import QueryBuilder
@@ -24,28 +26,44 @@ class TowerRepository:
         Args:
             db_path: Path to SQLite database
         """
+        self._db_path = db_path
         self._query_builder = QueryBuilder(db_path)
         self._settings = Settings()
 
-    def fetch_tower_ids(self) -> pl.DataFrame:
+        # Tower IDs with the database mtime they were read at; refetched
+        # after an import changes the file
+        self._cached_ids: Optional[Tuple[Optional[float], pl.DataFrame]] = None
+
+    def _db_mtime(self) -> Optional[float]:
+        """Last write time of the database (including a WAL file, if any)"""
+        paths = [self._db_path, f"{self._db_path}-wal"]
+        mtimes = [os.path.getmtime(p) for p in paths if os.path.exists(p)]
+        return max(mtimes) if mtimes else None
+
+    def fetch_tower_ids(self) -> pl.LazyFrame:
         """
         Fetch unique tower IDs from database
 
         Returns:
-            Polars DataFrame with TOWERID column
+            Polars LazyFrame with TOWERID column; callers collect it
         """
+        mtime = self._db_mtime()
+        if self._cached_ids is not None and self._cached_ids[0] == mtime:
+            return self._cached_ids[1].lazy()
+
         table = self._settings.TABLE_TA
         column = self._settings.TOWERID_COLUMNS[table]
 
-        query = self._query_builder.select(table=table, columns=[column], distinct=True)
-
-        df = self._query_builder.to_dataframe(query, engine="polars")
-
-        if not df.is_empty():
-            df = df.rename({column: "TOWERID"})
-
-            df = df.filter(
-                (pl.col("TOWERID").is_not_null()) & (pl.col("TOWERID") != "")
-            )
+        # Null / empty filtering and the rename happen inside SQLite
+        query = self._query_builder.select(
+            table=table,
+            columns=[f"{column} AS TOWERID"],
+            where=f"{column} IS NOT NULL AND {column} <> ''",
+            distinct=True,
+        )
 
-        return df
+        df = self._query_builder.to_dataframe(
+            query, engine="polars", schema_overrides={"TOWERID": pl.Utf8}
+        )
+        self._cached_ids = (mtime, df)
+        return df.lazy()
@@ -463,27 +463,11 @@ class LTEHourlyVisualizer:
         ]
 
         # Check which KPIs are available
-        available_kpis = []
-        for kpi in priority_kpis:
-            config = self.kpi_configs[kpi]
-            if "col" in config:
-                if config["col"] in df.columns:
-                    available_kpis.append(kpi)
-            else:
-                # Check if all required num/den columns exist
-                num_cols = (
-                    config["num"]
-                    if isinstance(config["num"], list)
-                    else [config["num"]]
-                )
-                den_cols = (
-                    config["den"]
-                    if isinstance(config["den"], list)
-                    else [config["den"]]
-                )
-
-                if all(col in df.columns for col in num_cols + den_cols):
-                    available_kpis.append(kpi)
+        available_kpis = [
+            kpi
+            for kpi in priority_kpis
+            if all(col in df.columns for col in self._kpi_columns(kpi))
+        ]
 
         if not available_kpis:
             st.error("❌ No KPIs can be calculated with available data")
@@ -493,8 +477,37 @@ class LTEHourlyVisualizer:
             )
             return
 
+        # Clean shared numeric columns and build band_sector_key once,
+        # instead of once per KPI
+        base_df = self._prepare_base(df, available_kpis)
+
         for kpi in available_kpis:
-            self.render_kpi_charts_by_sector(df, kpi)
+            self.render_kpi_charts_by_sector(base_df, kpi)
+
+    def _kpi_columns(self, kpi_name: str) -> List[str]:
+        """Return the source columns a KPI reads"""
+        config = self.kpi_configs[kpi_name]
+        if "col" in config:
+            return [config["col"]]
+
+        num_cols = config["num"] if isinstance(config["num"], list) else [config["num"]]
+        den_cols = config["den"] if isinstance(config["den"], list) else [config["den"]]
+        return num_cols + den_cols
+
+    def _prepare_base(self, df: pl.DataFrame, kpi_names: List[str]) -> pl.DataFrame:
+        """
+        Prepare the frame shared by all KPI charts
+
+        Cleans every column referenced by kpi_names to Float64 and adds
+        band_sector_key, so per-KPI preparation only computes kpi_value.
+        """
+        columns = dict.fromkeys(
+            col for kpi in kpi_names for col in self._kpi_columns(kpi)
+        )
+        for col in columns:
+            df = self._clean_numeric_column(df, col)
+
+        return self._create_band_sector_key(df)
 
     def _clean_numeric_column(self, df: pl.DataFrame, col_name: str) -> pl.DataFrame:
         """
@@ -507,6 +520,10 @@ class LTEHourlyVisualizer:
         try:
             col_dtype = df[col_name].dtype
 
+            # Already cleaned (e.g. by _prepare_base)
+            if col_dtype == pl.Float64:
+                return df
+
             # Already numeric - just ensure Float64
             if col_dtype in [pl.Int64, pl.Int32, pl.Float64, pl.Float32]:
                 df = df.with_columns(
@@ -697,8 +714,9 @@ class LTEHourlyVisualizer:
             logger.error(f"❌ Missing sector/band columns for grouping")
             return pl.DataFrame()
 
-        # Create band+sector key
-        chart_df = self._create_band_sector_key(chart_df)
+        # Create band+sector key (already present when called via render_all_kpis)
+        if "band_sector_key" not in chart_df.columns:
+            chart_df = self._create_band_sector_key(chart_df)
 
         # Verify datetime column
         if "lte_hour_begin_time" not in chart_df.columns:
@@ -7,7 +7,6 @@ Single Responsibility: Tower ID management
 """
 
 from typing import List
-import polars as pl
 from src.repositories.tower_repository import TowerRepository
 
 
@@ -33,15 +32,10 @@ class TowerService:
         Returns:
             List of unique tower IDs sorted alphabetically
         """
-        df = self._repository.fetch_tower_ids()
+        # IDs arrive DISTINCT from SQL; only the sort is left to Polars
+        df = self._repository.fetch_tower_ids().sort("TOWERID").collect()
 
-        if df.is_empty():
-            return []
-
-        # Get unique values and sort
-        tower_ids = df["TOWERID"].unique().sort().to_list()
-
-        return tower_ids
+        return df["TOWERID"].to_list()
 
     def validate_tower_ids(self, tower_ids: List[str]) -> bool:
         """
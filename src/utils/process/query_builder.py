@@ -3,11 +3,18 @@
 # ============================================================================
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from typing import List, Tuple, Literal, Dict, Union, Optional
 import polars as pl
 import pandas as pd
 
+# Memory-mapped I/O window per connection (256 MiB)
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Rows fetched from the cursor at a time for Polars results
+FETCH_BATCH_SIZE = 50_000
+
 
 class QueryBuilder:
     """SQL Query Builder for SQLite operations"""
@@ -21,15 +28,33 @@ class QueryBuilder:
         """
         self.db_path = db_path
 
+        # Idle connections reused across queries; concurrent callers each
+        # take their own, so parallel fetches never share a connection
+        self._pool: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """New connection with read-tuned PRAGMAs"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Context manager for a pooled database connection"""
+        with self._pool_lock:
+            conn = self._pool.pop() if self._pool else None
+        if conn is None:
+            conn = self._open_connection()
         try:
             yield conn
+        except Exception:
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            with self._pool_lock:
+                self._pool.append(conn)
 
     def execute(self, query: str, params: Tuple = None) -> List[sqlite3.Row]:
         """
@@ -68,26 +93,52 @@ class QueryBuilder:
     def to_dataframe(
         self,
         query: str,
-        params: Tuple = None,
+        params: Union[Tuple, List] = None,
         engine: Literal["pandas", "polars"] = "polars",
         infer_schema_length: Optional[int] = 10000,
+        schema_overrides: Optional[Dict[str, pl.DataType]] = None,
     ) -> Union[pl.DataFrame, pd.DataFrame]:
         """
         Execute query and return as DataFrame
 
+        Polars results are fetched in FETCH_BATCH_SIZE row batches and
+        converted batch by batch, so large results never hold every row as
+        Python tuples at once.
+
         Args:
-            query: SQL query
-            params: Query parameters
+            query: SQL query (may contain ? placeholders)
+            params: Query parameters bound to the ? placeholders
             engine: Return as Polars or Pandas DataFrame
+            schema_overrides: Fixed Polars dtypes per column; these columns
+                skip type inference and keep their dtype when empty
 
         Returns:
             DataFrame with query results
         """
         with self.get_connection() as conn:
             if engine == "polars":
-                return pl.read_database(
-                    query, conn, infer_schema_length=infer_schema_length
-                )
+                cursor = conn.cursor()
+                cursor.row_factory = None  # plain tuples for Polars
+                cursor.execute(query, params or ())
+                columns = [col[0] for col in cursor.description]
+
+                batches = []
+                while rows := cursor.fetchmany(FETCH_BATCH_SIZE):
+                    batches.append(
+                        pl.DataFrame(
+                            rows,
+                            schema=columns,
+                            orient="row",
+                            schema_overrides=schema_overrides,
+                            infer_schema_length=infer_schema_length,
+                        )
+                    )
+
+                if not batches:
+                    df = pl.DataFrame(schema=columns, schema_overrides=schema_overrides)
+                else:
+                    df = pl.concat(batches, how="vertical_relaxed")
+                return df
             else:
                 return pd.read_sql_query(query, conn, params=params)
 